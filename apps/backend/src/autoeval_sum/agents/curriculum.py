@@ -117,7 +117,7 @@ async def run_curriculum(
         next_suite_version=next_suite_version,
     )
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     try:
         raw = await loop.run_in_executor(None, _call_gemini, prompt)
     except Exception as exc:
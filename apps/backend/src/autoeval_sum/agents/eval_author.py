@@ -103,7 +103,7 @@ async def run_eval_author(
         failure_taxonomy=FAILURE_TAXONOMY,
     )
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     try:
         raw = await loop.run_in_executor(None, _call_gemini, prompt)
     except Exception as exc:
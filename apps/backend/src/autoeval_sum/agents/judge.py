@@ -9,6 +9,7 @@ Calls Gemini at temperature 0 with JSON mode.
 import asyncio
 import json
 import logging
+from typing import Any
 
 from google import generativeai as genai
 from google.generativeai import GenerativeModel
@@ -50,13 +51,26 @@ def _call_gemini(prompt: str) -> str:
     return response.text.strip()
 
 
+def _result_record(result: JudgeCaseResult) -> dict[str, Any]:
+    """
+    Serialise a validated JudgeCaseResult by alias without model_dump.
+
+    Every field is a plain scalar, list of str or the ScoreCard, so copying
+    the instance dicts gives the same record as model_dump(by_alias=True).
+    """
+    record = dict(result.__dict__)
+    record["scores"] = dict(result.scores.__dict__)
+    record["pass"] = record.pop("pass_result")
+    return record
+
+
 async def run_judge(
     eval_case: EvalCase,
     doc_text: str,
     summary: SummaryStructured,
-) -> JudgeCaseResult:
+) -> dict[str, Any]:
     """
-    Evaluate a single summary and return a validated JudgeCaseResult.
+    Evaluate a single summary and return a validated, serialised JudgeCaseResult.
 
     Parameters
     ----------
@@ -69,8 +83,9 @@ async def run_judge(
 
     Returns
     -------
-    JudgeCaseResult
-        Fully validated result with corrected pass flag (hallucination overrides).
+    dict
+        JudgeCaseResult dumped by alias ("pass" key), validated once here with
+        the corrected pass flag (hallucination overrides).
 
     Raises
     ------
@@ -90,7 +105,7 @@ async def run_judge(
 
     full_prompt = f"{system_prompt}\n\n{user_message}"
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     try:
         raw = await loop.run_in_executor(None, _call_gemini, full_prompt)
     except Exception as exc:
@@ -128,4 +143,4 @@ async def run_judge(
         result.hallucination_flag,
         result.failure_tags,
     )
-    return result
+    return _result_record(result)
@@ -97,7 +97,7 @@ async def run_summarizer(
         constraints=_format_constraints(constraints),
     )
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     try:
         raw = await loop.run_in_executor(
             None, _call_gemini, SUMMARIZER_SYSTEM_PROMPT, user_message
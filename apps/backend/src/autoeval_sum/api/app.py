@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -10,6 +11,7 @@ from autoeval_sum.api.routes.runs import router as runs_router
 from autoeval_sum.config.settings import get_settings
 from autoeval_sum.db.client import DynamoDBClient
 from autoeval_sum.db.runs import mark_stale_runs_failed
+from autoeval_sum.vector.client import close_pinecone_client
 
 log = logging.getLogger(__name__)
 
@@ -18,7 +20,8 @@ log = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Startup: mark any in-progress runs as failed (orphaned by a previous crash).
-    Shutdown: nothing to clean up (queue is in-process, DB connections are per-call).
+    Shutdown: release the vector client's IO thread pool (the queue is
+    in-process and DB connections are per-call).
     """
     settings = get_settings()
     runs_db = DynamoDBClient(
@@ -30,6 +33,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if stale:
         log.warning("Startup: marked %d orphaned run(s) as failed.", stale)
     yield
+    # close() waits for in-flight vector calls, so keep it off the event loop
+    await asyncio.to_thread(close_pinecone_client)
 
 
 def create_app() -> FastAPI:
@@ -13,6 +13,7 @@ import asyncio
 import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -97,42 +98,53 @@ class ExportResponse(BaseModel):
 
 # ── Background run executor ───────────────────────────────────────────────────
 
-async def _execute_run(run_id: str, config: RunConfig) -> None:
+def _db(table_name: str) -> DynamoDBClient:
+    settings = get_settings()
+    return DynamoDBClient(
+        table_name=table_name,
+        region=settings.aws_region,
+        endpoint_url=settings.dynamodb_endpoint_url,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_run_graph() -> Any:
     """
-    Long-running background coroutine that drives the full v1→v2 eval loop.
+    Return the compiled run pipeline, building it on first use.
 
-    Creates fresh DB/vector clients from settings (FastAPI DI is not available
-    in background tasks).  Acquires the run queue, invokes the compiled graph,
-    and ensures the run status is always written to DynamoDB even on failure.
+    Node factories only capture clients and settings — per-run data flows
+    through RunState — so a single compiled graph is shared by every run and
+    graph validation + Pregel construction stay off the per-run path.
     """
     settings = get_settings()
 
-    def _db(table_name: str) -> DynamoDBClient:
-        return DynamoDBClient(
-            table_name=table_name,
-            region=settings.aws_region,
-            endpoint_url=settings.dynamodb_endpoint_url,
-        )
-
-    runs_db = _db(settings.dynamodb_runs_table)
-    docs_db = _db(settings.dynamodb_documents_table)
-    suites_db = _db(settings.dynamodb_suites_table)
-    results_db = _db(settings.dynamodb_results_table)
-
     try:
         vector_client = get_pinecone_client()
     except Exception as exc:
         log.warning("Pinecone unavailable; running without vector memory: %s", exc)
         vector_client = None
 
-    graph = build_graph(
-        docs_db=docs_db,
-        runs_db=runs_db,
-        suites_db=suites_db,
-        results_db=results_db,
+    return build_graph(
+        docs_db=_db(settings.dynamodb_documents_table),
+        runs_db=_db(settings.dynamodb_runs_table),
+        suites_db=_db(settings.dynamodb_suites_table),
+        results_db=_db(settings.dynamodb_results_table),
         vector_client=vector_client,
     )
 
+
+async def _execute_run(run_id: str, config: RunConfig) -> None:
+    """
+    Long-running background coroutine that drives the full v1→v2 eval loop.
+
+    Uses the process-wide compiled graph (FastAPI DI is not available in
+    background tasks).  Acquires the run queue, invokes the graph, and ensures
+    the run status is always written to DynamoDB even on failure.
+    """
+    settings = get_settings()
+    runs_db = _db(settings.dynamodb_runs_table)
+    graph = _get_run_graph()
+
     initial_state = {
         "run_id": run_id,
         "seed": config.seed,
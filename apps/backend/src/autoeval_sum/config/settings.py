@@ -33,6 +33,13 @@ class Settings(BaseSettings):
     pinecone_embedding_dimension: int = Field(
         default=768, description="Embedding dimension for text-embedding-004"
     )
+    vector_pool_size: int = Field(
+        default=32, ge=1, description="Worker threads for Pinecone / embedding IO"
+    )
+    embedding_cache_path: str = Field(
+        default="",
+        description="SQLite file for the persistent embedding cache (empty disables it)",
+    )
 
     # ── DynamoDB ──────────────────────────────────────────────────────────────
     aws_region: str = Field(default="us-east-1", description="AWS region")
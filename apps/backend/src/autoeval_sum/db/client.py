@@ -12,6 +12,7 @@ Key conventions
 - Timestamps are stored as UTC ISO 8601 strings.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
 from typing import Any
@@ -21,6 +22,11 @@ from botocore.exceptions import ClientError
 
 log = logging.getLogger(__name__)
 
+# BatchWriteItem accepts at most 25 put/delete requests per call
+_BATCH_WRITE_LIMIT = 25
+_BATCH_WRITE_MAX_ATTEMPTS = 5
+_BATCH_WRITE_BASE_DELAY = 0.1
+
 
 # ── Type helpers ──────────────────────────────────────────────────────────────
 
@@ -141,6 +147,43 @@ class DynamoDBClient:
                 f"DynamoDB put_item failed on {self.table_name}: {exc}"
             ) from exc
 
+    async def batch_put_items(self, items: list[dict[str, Any]]) -> None:
+        """
+        Create or overwrite several items with BatchWriteItem.
+
+        Requests are chunked to DynamoDB's 25-item limit and any
+        ``UnprocessedItems`` are resent with exponential backoff.  Floats are
+        auto-converted to Decimal.
+        """
+        if not items:
+            return
+        try:
+            async with self._session.resource("dynamodb", **self._resource_kwargs()) as ddb:
+                for start in range(0, len(items), _BATCH_WRITE_LIMIT):
+                    chunk = items[start:start + _BATCH_WRITE_LIMIT]
+                    request_items: dict[str, Any] = {
+                        self.table_name: [
+                            {"PutRequest": {"Item": floats_to_decimals(item)}} for item in chunk
+                        ]
+                    }
+                    for attempt in range(_BATCH_WRITE_MAX_ATTEMPTS):
+                        response = await ddb.batch_write_item(RequestItems=request_items)
+                        request_items = response.get("UnprocessedItems") or {}
+                        if not request_items:
+                            break
+                        if attempt < _BATCH_WRITE_MAX_ATTEMPTS - 1:
+                            await asyncio.sleep(_BATCH_WRITE_BASE_DELAY * 2 ** attempt)
+                    else:
+                        pending = len(request_items.get(self.table_name, []))
+                        raise RuntimeError(
+                            f"DynamoDB batch_write_item left {pending} unprocessed item(s) "
+                            f"on {self.table_name}"
+                        )
+        except ClientError as exc:
+            raise RuntimeError(
+                f"DynamoDB batch_write_item failed on {self.table_name}: {exc}"
+            ) from exc
+
     async def update_item(
         self,
         pk: str,
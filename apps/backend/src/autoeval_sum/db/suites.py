@@ -24,6 +24,18 @@ def _now_utc() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _suite_item(run_id: str, suite_version: str, metrics: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pk": run_id,
+        "sk": suite_version,
+        "run_id": run_id,
+        "suite_version": suite_version,
+        "suite_id": f"{run_id}#{suite_version}",
+        "metrics": metrics,
+        "created_at": _now_utc(),
+    }
+
+
 async def save_suite(
     run_id: str,
     suite_version: str,
@@ -42,19 +54,33 @@ async def save_suite(
     metrics:
         Serialised SuiteMetrics dict.
     """
-    item: dict[str, Any] = {
-        "pk": run_id,
-        "sk": suite_version,
-        "run_id": run_id,
-        "suite_version": suite_version,
-        "suite_id": f"{run_id}#{suite_version}",
-        "metrics": metrics,
-        "created_at": _now_utc(),
-    }
-    await db.put_item(item)
+    await db.put_item(_suite_item(run_id, suite_version, metrics))
     log.debug("Saved suite %s#%s", run_id, suite_version)
 
 
+async def save_suites_batch(
+    run_id: str,
+    metrics_by_version: dict[str, dict[str, Any]],
+    db: DynamoDBClient,
+) -> None:
+    """
+    Persist suite metrics for several iterations of a run in one BatchWriteItem.
+
+    Parameters
+    ----------
+    run_id:
+        UUIDv7 run identifier.
+    metrics_by_version:
+        Iteration tag ("v1", "v2") → serialised SuiteMetrics dict.
+    """
+    items = [
+        _suite_item(run_id, suite_version, metrics)
+        for suite_version, metrics in metrics_by_version.items()
+    ]
+    await db.batch_put_items(items)
+    log.debug("Saved %d suite(s) for run %s", len(items), run_id)
+
+
 async def get_suite(
     run_id: str,
     suite_version: str,
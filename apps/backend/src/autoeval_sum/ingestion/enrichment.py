@@ -123,7 +123,7 @@ def _tag_difficulty(word_count: int, entity_density: float) -> str:
 async def _count_tokens(text: str) -> int:
     client = _get_client()
     settings = get_settings()
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def _call() -> int:
         result = client.models.count_tokens(model=settings.llm_model, contents=text)
@@ -165,7 +165,7 @@ async def _classify_category(text: str) -> str:
         categories=_CATEGORY_LIST_STR,
         text=text[:3000],  # use first 3 000 chars for classification
     )
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def _call() -> str:
         response = client.models.generate_content(
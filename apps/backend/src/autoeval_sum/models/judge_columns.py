@@ -0,0 +1,77 @@
+"""
+Column-oriented view of judge results.
+
+The judge nodes keep per-case results as serialised JudgeCaseResult dicts
+(the shape persisted to EvalResults).  JudgeResultsColumns transposes a suite's
+results once into parallel numpy arrays so suite metrics and failure
+selection are vectorised instead of re-scanning the dicts in Python.
+"""
+
+from typing import Any
+
+import numpy as np
+
+SCORE_DIMENSIONS = ("coverage", "faithfulness", "conciseness", "structure")
+
+
+class JudgeResultsColumns:
+    """
+    Structure-of-arrays over a list of serialised JudgeCaseResult dicts.
+
+    Row i of every column describes judge_results[i].  Scores are float64 so
+    averages match a plain Python mean exactly.
+
+    Columns
+    -------
+    eval_ids      object[n]     eval_id per result
+    scores        float64[n, 4] dimension scores, in SCORE_DIMENSIONS order
+    aggregate     float64[n]    aggregate_score
+    passed        bool[n]       the "pass" flag
+    failure_tags  list[list[str]] per-result tags (ragged, kept as lists)
+    """
+
+    __slots__ = ("eval_ids", "scores", "aggregate", "passed", "failure_tags")
+
+    def __init__(self, judge_results: list[dict[str, Any]]) -> None:
+        n = len(judge_results)
+        self.eval_ids = np.array([r["eval_id"] for r in judge_results], dtype=object)
+        self.scores = np.fromiter(
+            (r["scores"][dim] for r in judge_results for dim in SCORE_DIMENSIONS),
+            dtype=np.float64,
+            count=n * len(SCORE_DIMENSIONS),
+        ).reshape(n, len(SCORE_DIMENSIONS))
+        self.aggregate = np.fromiter(
+            (r["aggregate_score"] for r in judge_results), dtype=np.float64, count=n
+        )
+        self.passed = np.fromiter(
+            (bool(r.get("pass", True)) for r in judge_results), dtype=np.bool_, count=n
+        )
+        self.failure_tags: list[list[str]] = [r["failure_tags"] for r in judge_results]
+
+    def __len__(self) -> int:
+        return len(self.aggregate)
+
+    def failing_indices(self) -> np.ndarray:
+        """Row indices of failing results, in input order."""
+        return np.flatnonzero(~self.passed)
+
+    def lowest_indices(self, k: int) -> np.ndarray:
+        """
+        Row indices of the `k` lowest aggregate scores, lowest first.
+
+        argpartition selects the k smallest in O(N); only that slice is then
+        sorted, so the cost is O(N + k log k) rather than a full sort.  Ties,
+        including those at the k-th boundary, keep input order.
+        """
+        n = len(self.aggregate)
+        if k >= n:
+            return np.argsort(self.aggregate, kind="stable")
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        # Everything strictly below the k-th value is in; the remaining slots
+        # go to the earliest rows equal to it, as a stable sort would pick.
+        kth = self.aggregate[np.argpartition(self.aggregate, k - 1)[k - 1]]
+        below = np.flatnonzero(self.aggregate < kth)
+        ties = np.flatnonzero(self.aggregate == kth)[: k - len(below)]
+        picked = np.concatenate((below, ties))
+        return picked[np.argsort(self.aggregate[picked], kind="stable")]
@@ -12,8 +12,9 @@ from typing import Any
 
 from autoeval_sum.agents.curriculum import run_curriculum
 from autoeval_sum.agents.summarizer import AgentError
-from autoeval_sum.models.schemas import EvalCase, SuiteMetrics
-from autoeval_sum.runtime.nodes.helpers import doc_from_dynamo_item
+from autoeval_sum.models.documents import EnrichedDocument
+from autoeval_sum.models.schemas import SuiteMetrics
+from autoeval_sum.runtime.nodes.helpers import dump_eval_cases
 from autoeval_sum.runtime.policies import CURRICULUM_FLAT_TOKENS, with_retry
 from autoeval_sum.runtime.queue import get_run_queue
 from autoeval_sum.runtime.state import RunState
@@ -41,19 +42,19 @@ def make_curriculum_node(vector_client: PineconeClient | None = None) -> Any:
             log.info("Run %s: cancel before curriculum_v2.", run_id)
             return {"cancel_requested": True}
 
-        metrics_v1_data = state.get("metrics_v1")
-        if not metrics_v1_data:
+        metrics_v1: SuiteMetrics | None = state.get("metrics_v1")
+        if metrics_v1 is None:
             err = "curriculum_v2: metrics_v1 is missing — cannot generate v2 suite"
             log.error(err)
             errors = list(state.get("errors", []))
             errors.append(err)
             return {"errors": errors, "cancel_requested": True}
 
-        metrics_v1 = SuiteMetrics.model_validate(metrics_v1_data)
-        worst_examples = [EvalCase.model_validate(c) for c in metrics_v1.worst_examples]
+        # judge_v1 hands over the SuiteMetrics model itself, so worst_examples
+        # are already EvalCase instances.
+        worst_examples = metrics_v1.worst_examples
 
-        docs_data: list[dict[str, Any]] = state.get("docs", [])
-        enriched_docs = [doc_from_dynamo_item(item) for item in docs_data]
+        enriched_docs: list[EnrichedDocument] = state.get("docs_enriched", [])
         suite_size: int = state.get("suite_size", 20)
         budget_used: int = state.get("token_budget_used", 0)
         errors = list(state.get("errors", []))
@@ -77,7 +78,7 @@ def make_curriculum_node(vector_client: PineconeClient | None = None) -> Any:
             errors.append(f"curriculum_v2: {exc}")
             return {"errors": errors, "cancel_requested": True}
 
-        candidate_cases = [c.model_dump(by_alias=True) for c in output.next_suite]
+        candidate_cases = dump_eval_cases(output.next_suite)
         new_budget = budget_used + CURRICULUM_FLAT_TOKENS
 
         # Hard dedup filter: reject cases with cosine >= 0.90 against eval_prompts
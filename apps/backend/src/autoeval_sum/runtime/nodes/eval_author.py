@@ -10,7 +10,7 @@ from typing import Any
 
 from autoeval_sum.agents.eval_author import run_eval_author
 from autoeval_sum.agents.summarizer import AgentError
-from autoeval_sum.runtime.nodes.helpers import doc_from_dynamo_item
+from autoeval_sum.runtime.nodes.helpers import dump_eval_cases
 from autoeval_sum.runtime.policies import (
     EVAL_AUTHOR_FLAT_TOKENS,
     TokenBudgetExceededError,
@@ -46,12 +46,10 @@ def make_eval_author_node(
             log.info("Run %s: cancel before eval_author_%s.", run_id, suite_version)
             return {"cancel_requested": True}
 
-        docs = state.get("docs", [])
+        enriched_docs = state.get("docs_enriched", [])
         suite_size = state.get("suite_size", 20)
         budget_used = state.get("token_budget_used", 0)
 
-        enriched_docs = [doc_from_dynamo_item(item) for item in docs]
-
         try:
             cases = await with_retry(
                 run_eval_author,
@@ -66,7 +64,7 @@ def make_eval_author_node(
             errors.append(f"eval_author_{suite_version}: {exc}")
             return {"errors": errors, "cancel_requested": True}
 
-        serialised = [c.model_dump(by_alias=True) for c in cases]
+        serialised = dump_eval_cases(cases)
         new_budget = budget_used + EVAL_AUTHOR_FLAT_TOKENS
 
         # Upsert prompts to Pinecone for future dedup checks
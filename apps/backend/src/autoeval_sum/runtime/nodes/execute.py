@@ -10,8 +10,9 @@ import logging
 from typing import Any
 
 from autoeval_sum.agents.summarizer import AgentError, run_summarizer
+from autoeval_sum.models.documents import EnrichedDocument
 from autoeval_sum.models.schemas import EvalCase
-from autoeval_sum.runtime.nodes.helpers import doc_from_dynamo_item, read_doc_text
+from autoeval_sum.runtime.nodes.helpers import read_doc_text
 from autoeval_sum.runtime.policies import (
     SUMMARIZER_OVERHEAD_TOKENS,
     TokenBudget,
@@ -37,27 +38,30 @@ def make_execute_node(suite_version: str = "v1") -> Any:
     """
     from autoeval_sum.config.settings import get_settings
 
+    # Resolved once per graph build and captured by the closures below
+    settings = get_settings()
+    token_cap = settings.max_token_budget
+    workers = settings.run_workers
+    overhead_tokens = SUMMARIZER_OVERHEAD_TOKENS
+
     async def execute(state: RunState) -> dict:  # type: ignore[type-arg]
-        settings = get_settings()
         suite_key = f"eval_suite_{suite_version}"
         exec_key = f"executions_{suite_version}"
 
         suite_data: list[dict[str, Any]] = state.get(suite_key, [])  # type: ignore[assignment]
-        docs_data: list[dict[str, Any]] = state.get("docs", [])
+        docs: list[EnrichedDocument] = state.get("docs_enriched", [])
         budget_used: int = state.get("token_budget_used", 0)
-        existing_errors: list[str] = list(state.get("errors", []))
+        existing_errors: list[str] = state.get("errors", [])
 
         # Build a doc_id → doc lookup
-        doc_lookup = {
-            doc_from_dynamo_item(item).doc_id: doc_from_dynamo_item(item)
-            for item in docs_data
-        }
+        doc_lookup = {doc.doc_id: doc for doc in docs}
 
         suite = [EvalCase.model_validate(c) for c in suite_data]
-        budget = TokenBudget(cap=settings.max_token_budget, initial=budget_used)
-        sem = make_semaphore(settings.run_workers)
+        budget = TokenBudget(cap=token_cap, initial=budget_used)
+        sem = make_semaphore(workers)
         executions: list[CaseExecution] = []
-        errors = list(existing_errors)
+        # Only this node's errors; merged with existing_errors on return
+        new_errors: list[str] = []
         budget_exceeded = False
 
         async def run_one(case: EvalCase) -> CaseExecution:
@@ -112,7 +116,7 @@ def make_execute_node(suite_version: str = "v1") -> Any:
                         tokens_used=0,
                     )
 
-                tokens_est = doc.token_count + SUMMARIZER_OVERHEAD_TOKENS
+                tokens_est = doc.token_count + overhead_tokens
                 return CaseExecution(
                     eval_id=case.eval_id,
                     doc_id=case.doc_id,
@@ -130,13 +134,13 @@ def make_execute_node(suite_version: str = "v1") -> Any:
             executions.append(result)
 
             if result["error"]:
-                errors.append(f"{result['eval_id']}: {result['error']}")
+                new_errors.append(f"{result['eval_id']}: {result['error']}")
 
             try:
                 budget.add(result["tokens_used"])
             except TokenBudgetExceededError as exc:
                 log.warning("Token budget exceeded during %s: %s", suite_version, exc)
-                errors.append(f"token_cap_exceeded: {exc}")
+                new_errors.append(f"token_cap_exceeded: {exc}")
                 budget_exceeded = True
                 # Cancel outstanding tasks and break
                 for t in tasks:
@@ -172,7 +176,7 @@ def make_execute_node(suite_version: str = "v1") -> Any:
         updates: dict[str, Any] = {
             exec_key: executions,
             "token_budget_used": budget.used,
-            "errors": errors,
+            "errors": existing_errors + new_errors if new_errors else existing_errors,
         }
         if budget_exceeded:
             updates["cancel_requested"] = True
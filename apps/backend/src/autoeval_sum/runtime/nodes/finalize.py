@@ -7,8 +7,9 @@ from typing import Any
 
 from autoeval_sum.db.client import DynamoDBClient
 from autoeval_sum.db.runs import update_run_status
-from autoeval_sum.db.suites import save_suite
+from autoeval_sum.db.suites import save_suites_batch
 from autoeval_sum.models.runs import RunStatus
+from autoeval_sum.models.schemas import SuiteMetrics
 from autoeval_sum.runtime.queue import get_run_queue
 from autoeval_sum.runtime.state import RunState
 
@@ -33,10 +34,19 @@ def make_finalize_node(
     async def finalize(state: RunState) -> dict:  # type: ignore[type-arg]
         run_id: str = state.get("run_id", "unknown")
         errors: list[str] = state.get("errors", [])
-        metrics_v1: dict[str, Any] | None = state.get("metrics_v1")
-        metrics_v2: dict[str, Any] | None = state.get("metrics_v2")
+        # Metrics travel through state as models; dump once at the persistence boundary
+        metrics_v1_model: SuiteMetrics | None = state.get("metrics_v1")
+        metrics_v2_model: SuiteMetrics | None = state.get("metrics_v2")
+        metrics_v1: dict[str, Any] | None = (
+            metrics_v1_model.model_dump() if metrics_v1_model is not None else None
+        )
+        metrics_v2: dict[str, Any] | None = (
+            metrics_v2_model.model_dump() if metrics_v2_model is not None else None
+        )
 
-        # Determine terminal status
+        # Determine terminal status.  The queue flag is authoritative for user
+        # cancels: state["cancel_requested"] is also set by nodes that abort on
+        # agent errors, which must finalise as completed_with_errors instead.
         if get_run_queue().check_cancel():
             final_status = RunStatus.failed
             log.info("Run %s: finalising as failed (cancel requested).", run_id)
@@ -50,28 +60,29 @@ def make_finalize_node(
             final_status = RunStatus.completed
             log.info("Run %s: finalising as completed.", run_id)
 
-        # Persist run terminal state
+        # Persist run terminal state (only the first five errors are surfaced)
+        error_message = "; ".join(errors[:5]) if errors else None
         await update_run_status(
             run_id,
             final_status,
             runs_db,
-            error_message="; ".join(errors[:5]) if errors else None,
+            error_message=error_message,
             metrics_v1=metrics_v1,
             metrics_v2=metrics_v2,
         )
 
-        # Persist suite-level metrics to EvalSuites
+        # Persist suite-level metrics to EvalSuites in a single BatchWriteItem
         if suites_db is not None:
-            if metrics_v1:
-                try:
-                    await save_suite(run_id, "v1", metrics_v1, suites_db)
-                except Exception as exc:
-                    log.error("Failed to persist suite v1 for run %s: %s", run_id, exc)
-            if metrics_v2:
+            suite_metrics = {
+                version: metrics
+                for version, metrics in (("v1", metrics_v1), ("v2", metrics_v2))
+                if metrics
+            }
+            if suite_metrics:
                 try:
-                    await save_suite(run_id, "v2", metrics_v2, suites_db)
+                    await save_suites_batch(run_id, suite_metrics, suites_db)
                 except Exception as exc:
-                    log.error("Failed to persist suite v2 for run %s: %s", run_id, exc)
+                    log.error("Failed to persist suites for run %s: %s", run_id, exc)
 
         return {"final_status": final_status.value}
 
@@ -6,17 +6,36 @@ so individual node files stay focused on orchestration logic.
 """
 
 import logging
+import operator
 from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from autoeval_sum.config.settings import get_settings
 
 from autoeval_sum.models.documents import EnrichedDocument
-from autoeval_sum.models.schemas import EvalCase, JudgeCaseResult, SuiteMetrics
+from autoeval_sum.models.judge_columns import SCORE_DIMENSIONS, JudgeResultsColumns
+from autoeval_sum.models.schemas import EvalCase, SuiteMetrics
 
 log = logging.getLogger(__name__)
 
+_EVAL_CASE_LIST = TypeAdapter(list[EvalCase])
+
+_doc_mandatory_fields = operator.itemgetter(
+    "doc_id",
+    "word_count",
+    "token_count",
+    "entity_density",
+    "difficulty_tag",
+    "category_tag",
+    "content_path",
+)
+
 
 # ── Document helpers ──────────────────────────────────────────────────────────
 
@@ -27,45 +46,92 @@ def doc_from_dynamo_item(item: dict[str, Any]) -> EnrichedDocument:
     The `text` field is set to "" because it is only used in execute nodes
     (which read from content_path directly). For catalog-only uses (eval_author,
     curriculum) the empty string is fine.
+
+    Records were validated as EnrichedDocument at ingestion, so the model is
+    built with model_construct; the explicit coercions only normalise the
+    Decimal numbers DynamoDB returns.
     """
-    return EnrichedDocument(
-        doc_id=str(item["doc_id"]),
+    doc_id, word_count, token_count, entity_density, difficulty_tag, category_tag, content_path = (
+        _doc_mandatory_fields(item)
+    )
+    return EnrichedDocument.model_construct(
+        doc_id=str(doc_id),
         text="",
         url=str(item.get("url", "")),
         source_query_id=int(item.get("source_query_id", 0)),
-        word_count=int(item["word_count"]),
-        token_count=int(item["token_count"]),
+        word_count=int(word_count),
+        token_count=int(token_count),
         was_truncated=bool(item.get("was_truncated", False)),
-        entity_density=float(item["entity_density"]),
-        difficulty_tag=item["difficulty_tag"],
-        category_tag=str(item["category_tag"]),
-        content_path=str(item["content_path"]),
+        entity_density=float(entity_density),
+        difficulty_tag=difficulty_tag,
+        category_tag=str(category_tag),
+        content_path=str(content_path),
     )
 
 
+@lru_cache(maxsize=1024)
 def read_doc_text(content_path: str) -> str:
     """Read document text from its on-disk content file.
 
     content_path is relative to the data/ root (e.g. "corpus/{doc_id}.txt").
+    Results are memoised: corpus files are written once per doc_id at
+    ingestion and never modified, so each file is read at most once per
+    process (execute and judge both read the same documents).
+    The file is read as bytes and decoded in one step, skipping the text-mode
+    reader; ingestion writes these files itself, so no newline translation
+    is needed.
     """
     path = Path(get_settings().data_dir) / content_path
-    if not path.exists():
-        raise FileNotFoundError(f"Document text not found at {content_path}")
-    return path.read_text(encoding="utf-8")
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Document text not found at {content_path}") from exc
+    return data.decode("utf-8")
 
 
 def doc_map_from_items(items: list[dict[str, Any]]) -> dict[str, EnrichedDocument]:
     """Return a doc_id → EnrichedDocument index for fast lookup."""
-    return {doc_from_dynamo_item(item).doc_id: doc_from_dynamo_item(item) for item in items}
+    return {(doc := doc_from_dynamo_item(item)).doc_id: doc for item in items}
+
+
+# ── Eval case helpers ─────────────────────────────────────────────────────────
+
+def dump_eval_cases(cases: list[EvalCase]) -> list[dict[str, Any]]:
+    """Serialise an EvalCase list for RunState in a single pydantic-core pass."""
+    return _EVAL_CASE_LIST.dump_python(cases, by_alias=True)  # type: ignore[no-any-return]
 
 
 # ── Metrics helpers ───────────────────────────────────────────────────────────
 
+def top_failure_tags(
+    judge_results: list[dict[str, Any]],
+    n: int = 5,
+    columns: JudgeResultsColumns | None = None,
+) -> list[tuple[str, int]]:
+    """
+    Return the `n` most frequent failure tags among failing results.
+
+    Tags are counted in one Counter pass over the flattened tag lists.  When
+    `columns` is given, failing rows come from its pass mask instead of a
+    scan of `judge_results`.
+    """
+    if columns is not None:
+        tag_lists: Iterable[Iterable[str]] = (
+            columns.failure_tags[i] for i in columns.failing_indices()
+        )
+    else:
+        tag_lists = (
+            r.get("failure_tags") or () for r in judge_results if not r.get("pass", True)
+        )
+    return Counter(chain.from_iterable(tag_lists)).most_common(n)
+
+
 def compute_suite_metrics(
     suite_id: str,
     eval_suite: list[dict[str, Any]],
     judge_results: list[dict[str, Any]],
     suite_size: int = 20,
+    columns: JudgeResultsColumns | None = None,
 ) -> SuiteMetrics:
     """
     Derive SuiteMetrics from judge results.
@@ -81,12 +147,13 @@ def compute_suite_metrics(
     suite_size:
         Total number of cases in the suite. Used to derive the regression-core
         size (40% of suite_size, minimum 1) passed to the Curriculum agent.
+    columns:
+        Optional JudgeResultsColumns already built over `judge_results`;
+        built here when omitted.
     """
     if not judge_results:
         # No results — return zero metrics
-        zero_dims = {
-            "coverage": 0.0, "faithfulness": 0.0, "conciseness": 0.0, "structure": 0.0
-        }
+        zero_dims = {dim: 0.0 for dim in SCORE_DIMENSIONS}
         return SuiteMetrics(
             suite_id=suite_id,
             avg_scores_by_dimension=zero_dims,
@@ -97,49 +164,33 @@ def compute_suite_metrics(
             worst_examples=[],
         )
 
-    validated_results = [JudgeCaseResult.model_validate(r) for r in judge_results]
-    n = len(validated_results)
+    # judge_results were produced by validated JudgeCaseResult models; their
+    # columnar view turns every aggregate below into a vectorised reduction.
+    if columns is None:
+        columns = JudgeResultsColumns(judge_results)
+    n = len(columns)
 
-    # Dimension averages
-    dim_totals: dict[str, float] = {
-        "coverage": 0.0,
-        "faithfulness": 0.0,
-        "conciseness": 0.0,
-        "structure": 0.0,
+    means = columns.scores.mean(axis=0)
+    pass_count = int(columns.passed.sum())
+    fail_count = n - pass_count
+
+    avg_scores = {
+        dim: round(float(mean), 4) for dim, mean in zip(SCORE_DIMENSIONS, means, strict=True)
     }
-    aggregate_total = 0.0
-    pass_count = 0
-    fail_count = 0
-    failure_tag_counter: Counter[str] = Counter()
-
-    for r in validated_results:
-        dim_totals["coverage"] += r.scores.coverage
-        dim_totals["faithfulness"] += r.scores.faithfulness
-        dim_totals["conciseness"] += r.scores.conciseness
-        dim_totals["structure"] += r.scores.structure
-        aggregate_total += r.aggregate_score
-        if r.pass_result:
-            pass_count += 1
-        else:
-            fail_count += 1
-            for tag in r.failure_tags:
-                failure_tag_counter[tag] += 1
-
-    avg_scores = {dim: round(total / n, 4) for dim, total in dim_totals.items()}
-    aggregate_avg = round(aggregate_total / n, 4)
+    aggregate_avg = round(float(columns.aggregate.mean()), 4)
     pass_rate = round(pass_count / n, 4)
     failure_detection_rate = round(fail_count / n, 4)
-    top_failure_modes = [tag for tag, _ in failure_tag_counter.most_common(5)]
+    top_failure_modes = [tag for tag, _ in top_failure_tags(judge_results, 5, columns=columns)]
 
-    # Worst examples: bottom 40% of suite_size (regression core for curriculum)
+    # Worst examples: bottom 40% of suite_size (regression core for curriculum).
+    # Suite entries were validated when authored, so model_construct skips
+    # re-validation; indexing by eval_id avoids rescanning the whole suite.
     n_worst = max(1, round(suite_size * 0.4))
-    result_by_eval_id = {r.eval_id: r for r in validated_results}
-    sorted_results = sorted(validated_results, key=lambda r: r.aggregate_score)
-    worst_eval_ids = {r.eval_id for r in sorted_results[:n_worst]}
+    suite_index = {c["eval_id"]: c for c in eval_suite}
     worst_examples = [
-        EvalCase.model_validate(c)
-        for c in eval_suite
-        if c.get("eval_id") in worst_eval_ids
+        EvalCase.model_construct(**suite_index[eval_id])
+        for eval_id in columns.eval_ids[columns.lowest_indices(n_worst)]
+        if eval_id in suite_index
     ]
 
     log.info(
@@ -147,8 +198,6 @@ def compute_suite_metrics(
         suite_id, n, pass_rate, aggregate_avg, top_failure_modes[:3],
     )
 
-    _ = result_by_eval_id  # referenced for completeness, not used directly
-
     return SuiteMetrics(
         suite_id=suite_id,
         avg_scores_by_dimension=avg_scores,
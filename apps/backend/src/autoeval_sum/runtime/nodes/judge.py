@@ -9,16 +9,18 @@ failure exemplars for the curriculum agent.
 
 import asyncio
 import logging
+from collections import deque
 from typing import Any
 
 from autoeval_sum.agents.judge import run_judge
 from autoeval_sum.agents.summarizer import AgentError
 from autoeval_sum.db.client import DynamoDBClient
 from autoeval_sum.db.results import save_results_batch
+from autoeval_sum.models.documents import EnrichedDocument
+from autoeval_sum.models.judge_columns import JudgeResultsColumns
 from autoeval_sum.models.schemas import EvalCase, SummaryStructured
 from autoeval_sum.runtime.nodes.helpers import (
     compute_suite_metrics,
-    doc_from_dynamo_item,
     read_doc_text,
 )
 from autoeval_sum.runtime.policies import (
@@ -31,10 +33,13 @@ from autoeval_sum.runtime.policies import (
 from autoeval_sum.runtime.queue import get_run_queue
 from autoeval_sum.runtime.state import RunState
 from autoeval_sum.vector.client import PineconeClient
-from autoeval_sum.vector.memory import retrieve_failure_exemplars, store_failures
+from autoeval_sum.vector.memory import retrieve_failure_exemplars_per_tag, store_failures
 
 log = logging.getLogger(__name__)
 
+# Summaries in state were validated by the execute node; only check they are complete
+_SUMMARY_FIELDS = frozenset(SummaryStructured.model_fields)
+
 
 def make_judge_node(
     suite_version: str = "v1",
@@ -62,8 +67,14 @@ def make_judge_node(
 
     iteration_n = suite_version.lstrip("v")
 
+    # Resolved once per graph build and captured by the closures below
+    settings = get_settings()
+    token_cap = settings.max_token_budget
+    workers = settings.run_workers
+    default_suite_size = settings.default_suite_size
+    overhead_tokens = JUDGE_OVERHEAD_TOKENS
+
     async def judge(state: RunState) -> dict:  # type: ignore[type-arg]
-        settings = get_settings()
         exec_key = f"executions_{suite_version}"
         suite_key = f"eval_suite_{suite_version}"
         results_key = f"judge_results_{suite_version}"
@@ -71,26 +82,40 @@ def make_judge_node(
 
         executions = state.get(exec_key, [])
         suite_data: list[dict[str, Any]] = state.get(suite_key, [])  # type: ignore[assignment]
-        docs_data: list[dict[str, Any]] = state.get("docs", [])
+        docs: list[EnrichedDocument] = state.get("docs_enriched", [])
         run_id: str = state.get("run_id", "unknown")
         budget_used: int = state.get("token_budget_used", 0)
-        existing_errors: list[str] = list(state.get("errors", []))
+        existing_errors: list[str] = state.get("errors", [])
 
         # Quick-exit on cancel
-        if get_run_queue().check_cancel():
+        queue = get_run_queue()
+        if queue.check_cancel():
             log.info("Run %s: cancel before judge_%s.", run_id, suite_version)
             return {"cancel_requested": True}
 
-        doc_lookup = {
-            doc_from_dynamo_item(item).doc_id: doc_from_dynamo_item(item)
-            for item in docs_data
-        }
-        suite_by_id = {c["eval_id"]: EvalCase.model_validate(c) for c in suite_data}
-
-        budget = TokenBudget(cap=settings.max_token_budget, initial=budget_used)
-        sem = make_semaphore(settings.run_workers)
-        judge_results: list[dict[str, Any]] = []
-        errors = list(existing_errors)
+        doc_lookup = {doc.doc_id: doc for doc in docs}
+        suite_raw_by_id = {c["eval_id"]: c for c in suite_data}
+
+        budget = TokenBudget(cap=token_cap, initial=budget_used)
+        sem = make_semaphore(workers)
+        # Only this node's errors, appended to by concurrent judge_one tasks;
+        # merged with existing_errors (copying only if any) on return
+        new_errors: deque[str] = deque()
+
+        # Read every referenced document up front, in parallel worker threads,
+        # so no blocking file IO happens on the event loop or under the semaphore.
+        needed_paths = list({
+            doc_lookup[e["doc_id"]].content_path
+            for e in executions
+            if e.get("summary") is not None and e["doc_id"] in doc_lookup
+        })
+        read_results = await asyncio.gather(
+            *(asyncio.to_thread(read_doc_text, path) for path in needed_paths),
+            return_exceptions=True,
+        )
+        doc_texts: dict[str, str | BaseException] = dict(
+            zip(needed_paths, read_results, strict=True)
+        )
 
         async def judge_one(exec_item: dict[str, Any]) -> dict[str, Any] | None:
             """Score one execution result; returns None on skip/error."""
@@ -102,88 +127,127 @@ def make_judge_node(
                 return None
 
             async with sem:
-                if get_run_queue().check_cancel():
+                if queue.check_cancel():
                     return None
 
-                eval_case = suite_by_id.get(eval_id)
-                if eval_case is None:
+                raw_case = suite_raw_by_id.get(eval_id)
+                if raw_case is None:
                     log.warning("EvalCase %s not found; skipping judge.", eval_id)
                     return None
+                # Suite entries were validated when authored; build only on demand
+                eval_case = EvalCase.model_construct(**raw_case)
 
                 doc = doc_lookup.get(doc_id)
                 if doc is None:
                     log.warning("Doc %s not found for judge of %s.", doc_id, eval_id)
                     return None
 
-                try:
-                    doc_text = read_doc_text(doc.content_path)
-                except FileNotFoundError as exc:
-                    errors.append(f"judge_{suite_version}/{eval_id}: {exc}")
+                doc_text = doc_texts[doc.content_path]
+                if isinstance(doc_text, FileNotFoundError):
+                    new_errors.append(f"judge_{suite_version}/{eval_id}: {doc_text}")
+                    return None
+                if isinstance(doc_text, BaseException):
+                    raise doc_text
+
+                missing = _SUMMARY_FIELDS.difference(raw_summary)
+                if missing:
+                    new_errors.append(
+                        f"judge_{suite_version}/{eval_id}: bad summary schema: "
+                        f"missing {sorted(missing)}"
+                    )
+                    return None
+                summary = SummaryStructured.model_construct(**raw_summary)
+
+                # Skip the LLM call outright if its estimated tokens would exceed
+                # the remaining budget
+                tokens_est = doc.token_count + overhead_tokens
+                if budget.would_exceed(tokens_est):
+                    exc = TokenBudgetExceededError(budget.used + tokens_est, budget.cap)
+                    new_errors.append(f"token_cap_exceeded during judge_{suite_version}: {exc}")
                     return None
 
+                # Race the LLM call against cancellation so a cancel request
+                # aborts in-flight cases instead of waiting for them to finish.
+                judge_task = asyncio.ensure_future(
+                    with_retry(run_judge, eval_case, doc_text, summary, max_retries=3)
+                )
+                cancel_task = asyncio.ensure_future(queue.wait_cancel())
                 try:
-                    summary = SummaryStructured.model_validate(raw_summary)
-                except Exception as exc:
-                    errors.append(f"judge_{suite_version}/{eval_id}: bad summary schema: {exc}")
+                    await asyncio.wait(
+                        (judge_task, cancel_task), return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    cancel_task.cancel()
+                    if not judge_task.done():
+                        judge_task.cancel()
+                if not judge_task.done() or judge_task.cancelled():
+                    log.info("Judge of %s aborted by cancel request.", eval_id)
                     return None
 
                 try:
-                    result = await with_retry(
-                        run_judge,
-                        eval_case,
-                        doc_text,
-                        summary,
-                        max_retries=3,
-                    )
+                    result = judge_task.result()
                 except AgentError as exc:
                     log.warning("Judge failed for %s: %s", eval_id, exc)
-                    errors.append(f"judge_{suite_version}/{eval_id}: {exc}")
+                    new_errors.append(f"judge_{suite_version}/{eval_id}: {exc}")
                     return None
 
-                tokens_est = doc.token_count + JUDGE_OVERHEAD_TOKENS
+                # Re-checked here: concurrent cases may have used the headroom
                 try:
                     budget.add(tokens_est)
                 except TokenBudgetExceededError as exc:
-                    errors.append(f"token_cap_exceeded during judge_{suite_version}: {exc}")
+                    new_errors.append(f"token_cap_exceeded during judge_{suite_version}: {exc}")
                     return None
 
-                return result.model_dump(by_alias=True)
+                return result
 
-        tasks = [asyncio.create_task(judge_one(e)) for e in executions]
-        for done_task in asyncio.as_completed(tasks):
-            result_dict = await done_task
-            if result_dict is not None:
-                judge_results.append(result_dict)
+        # Completion order is irrelevant here, so gather (suite order) and
+        # drop skipped cases rather than waking once per task.
+        outcomes = await asyncio.gather(*(judge_one(e) for e in executions))
+        judge_results: list[dict[str, Any]] = [r for r in outcomes if r is not None]
 
         suite_id = f"{run_id}#v{iteration_n}"
-        suite_size: int = state.get("suite_size", settings.default_suite_size)  # type: ignore[assignment]
-        metrics = compute_suite_metrics(suite_id, suite_data, judge_results, suite_size=suite_size)
+        suite_size: int = state.get("suite_size", default_suite_size)  # type: ignore[assignment]
+        # Transposed once; shared by metrics and failure selection
+        columns = JudgeResultsColumns(judge_results)
+        metrics = compute_suite_metrics(
+            suite_id, suite_data, judge_results, suite_size=suite_size, columns=columns
+        )
 
         # Persist results to DynamoDB
-        if results_db is not None and judge_results:
+        async def persist_results() -> None:
+            if results_db is None or not judge_results:
+                return
             try:
                 await save_results_batch(suite_id, judge_results, results_db)
             except Exception as exc:
                 log.error("Failed to persist results for %s: %s", suite_id, exc)
-                errors.append(f"persist_results_{suite_version}: {exc}")
+                new_errors.append(f"persist_results_{suite_version}: {exc}")
 
         # Pinecone failure memory (v1 only — v2 failures go to storage but not used further)
-        failure_exemplars: list[str] = []
-        if vector_client is not None:
+        async def update_failure_memory() -> list[str]:
+            if vector_client is None:
+                return []
             try:
                 await store_failures(
-                    judge_results, suite_data, run_id, suite_version, vector_client
+                    judge_results, suite_data, run_id, suite_version, vector_client,
+                    columns=columns,
                 )
             except Exception as exc:
                 log.error("Failed to store failures in Pinecone: %s", exc)
 
-            if suite_version == "v1" and metrics.top_failure_modes:
-                try:
-                    failure_exemplars = await retrieve_failure_exemplars(
-                        metrics.top_failure_modes, vector_client
-                    )
-                except Exception as exc:
-                    log.warning("Failed to retrieve failure exemplars: %s", exc)
+            if suite_version != "v1" or not metrics.top_failure_modes:
+                return []
+            try:
+                return await retrieve_failure_exemplars_per_tag(
+                    metrics.top_failure_modes, vector_client
+                )
+            except Exception as exc:
+                log.warning("Failed to retrieve failure exemplars: %s", exc)
+                return []
+
+        # DynamoDB and Pinecone are independent, so the two paths overlap;
+        # exemplar retrieval still follows the failure upsert it may read.
+        _, failure_exemplars = await asyncio.gather(persist_results(), update_failure_memory())
 
         log.info(
             "Run %s: judge_%s — %d results  pass_rate=%.2f  aggregate=%.2f",
@@ -195,9 +259,9 @@ def make_judge_node(
 
         updates: dict[str, Any] = {
             results_key: judge_results,
-            metrics_key: metrics.model_dump(),
+            metrics_key: metrics,
             "token_budget_used": budget.used,
-            "errors": errors,
+            "errors": existing_errors + list(new_errors) if new_errors else existing_errors,
         }
         if failure_exemplars:
             updates["pinecone_failure_exemplars"] = failure_exemplars
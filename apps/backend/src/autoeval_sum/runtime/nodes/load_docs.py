@@ -1,5 +1,8 @@
 """
 load_docs node — loads all enriched document records from DynamoDB.
+
+Items are parsed into EnrichedDocument once here and carried in state as
+``docs_enriched`` so downstream nodes never re-parse the raw records.
 """
 
 import logging
@@ -7,6 +10,7 @@ from typing import Any
 
 from autoeval_sum.db.client import DynamoDBClient
 from autoeval_sum.ingestion.persist import list_documents
+from autoeval_sum.runtime.nodes.helpers import doc_from_dynamo_item
 from autoeval_sum.runtime.state import RunState
 
 log = logging.getLogger(__name__)
@@ -24,8 +28,12 @@ def make_load_docs_node(
             log.error("No documents found in corpus. Run POST /api/v1/ingestion/prepare first.")
             return {
                 "docs": [],
+                "docs_enriched": [],
                 "errors": ["Corpus is empty — run ingestion before starting an eval run."],
             }
-        return {"docs": items}
+        return {
+            "docs": items,
+            "docs_enriched": [doc_from_dynamo_item(item) for item in items],
+        }
 
     return load_docs
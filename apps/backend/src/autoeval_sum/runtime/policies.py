@@ -4,15 +4,21 @@ Execution policies for the LangGraph runtime.
 Provides:
 - TokenBudget  — tracks cumulative token usage; raises TokenBudgetExceeded on cap
 - with_retry   — async 3-retry exponential backoff with jitter for external calls
+- is_retriable_error — default with_retry predicate; fails fast on client errors
 - make_semaphore — creates a bounded asyncio.Semaphore
 """
 
 import asyncio
 import logging
 import random
+from collections.abc import Callable
 
 log = logging.getLogger(__name__)
 
+# Private generator for retry jitter so backoff neither touches nor depends on
+# the shared module-level random state.
+_jitter_rng = random.Random()
+
 # Per-call token overhead estimates (prompt + response, excluding doc text)
 SUMMARIZER_OVERHEAD_TOKENS = 600
 JUDGE_OVERHEAD_TOKENS = 400
@@ -35,20 +41,30 @@ class TokenBudget:
 
     Thread-safe for asyncio (single-threaded event loop).
     Raises TokenBudgetExceeded on the call that would push over the cap.
+    Only the remaining headroom is stored; `used` is derived from it.
     """
 
     def __init__(self, cap: int, initial: int = 0) -> None:
         self._cap = cap
-        self._used = initial
+        self._remaining = cap - initial
 
     @property
     def used(self) -> int:
-        return self._used
+        return self._cap - self._remaining
 
     @property
     def cap(self) -> int:
         return self._cap
 
+    @property
+    def remaining(self) -> int:
+        """Tokens left before the cap (negative if initialised over it)."""
+        return self._remaining
+
+    def would_exceed(self, tokens: int) -> bool:
+        """Return True if adding `tokens` now would push the total over the cap."""
+        return tokens > self._remaining
+
     def add(self, tokens: int) -> None:
         """
         Add `tokens` to the running total.
@@ -58,10 +74,32 @@ class TokenBudget:
         TokenBudgetExceededError
             If the new total would exceed the cap.
         """
-        new_total = self._used + tokens
-        if new_total > self._cap:
-            raise TokenBudgetExceededError(new_total, self._cap)
-        self._used = new_total
+        self._remaining -= tokens
+        if self._remaining < 0:
+            self._remaining += tokens
+            raise TokenBudgetExceededError(self._cap - self._remaining + tokens, self._cap)
+
+
+# HTTP 4xx statuses that can still succeed on a later attempt
+_RETRIABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+def is_retriable_error(exc: BaseException) -> bool:
+    """
+    Return False for errors that no retry can fix.
+
+    Upstream API errors (e.g. google.api_core exceptions) carry the HTTP
+    status as an int `code`, either on the exception itself or on the
+    `__cause__` an AgentError wraps.  A 4xx other than 408/429 is a bad
+    request, auth or permission failure and is terminal; everything else
+    (5xx, timeouts, connection errors, parse/validation failures of
+    non-deterministic LLM output) is retried.
+    """
+    for err in (exc, exc.__cause__):
+        code = getattr(err, "code", None)
+        if isinstance(code, int) and 400 <= code < 500:
+            return code in _RETRIABLE_CLIENT_STATUSES
+    return True
 
 
 async def with_retry(
@@ -70,6 +108,7 @@ async def with_retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
     jitter: float = 0.3,
+    retriable: Callable[[Exception], bool] = is_retriable_error,
     **kwargs: object,
 ) -> object:
     """
@@ -88,11 +127,15 @@ async def with_retry(
         Initial wait before first retry in seconds (doubles each attempt).
     jitter:
         Maximum random jitter fraction added to each delay.
+    retriable:
+        Predicate deciding whether an exception is worth another attempt.
+        Non-retriable exceptions are re-raised immediately without backoff.
 
     Raises
     ------
     Exception
-        Re-raises the last exception if all attempts are exhausted.
+        Re-raises the last exception if all attempts are exhausted, or the
+        first non-retriable one.
     """
     last_exc: Exception | None = None
     delay = base_delay
@@ -101,6 +144,13 @@ async def with_retry(
             return await coro_fn(*args, **kwargs)
         except Exception as exc:
             last_exc = exc
+            if not retriable(exc):
+                log.warning(
+                    "Non-retriable error from %s: %s",
+                    getattr(coro_fn, "__name__", repr(coro_fn)),
+                    exc,
+                )
+                break
             if attempt == max_retries:
                 log.warning(
                     "All %d retries exhausted for %s: %s",
@@ -109,7 +159,7 @@ async def with_retry(
                     exc,
                 )
                 break
-            jitter_secs = random.uniform(0, jitter * delay)
+            jitter_secs = _jitter_rng.uniform(0, jitter * delay)
             wait = delay + jitter_secs
             log.info(
                 "Attempt %d/%d failed (%s); retrying in %.2fs",
@@ -1,10 +1,11 @@
 """
 Run queue — single active run + FIFO waiting list.
 
-Only one run executes at a time.  Concurrent start requests are serialised
-via an asyncio.Lock; callers that arrive while a run is active receive
-`queued` status and wait for the active run to finish (or be cancelled)
-before proceeding.
+By default only one run executes at a time.  Concurrent start requests are
+admitted in arrival order via an asyncio.Condition guarding an active-run
+counter; callers that arrive while every slot is taken receive `queued`
+status and wait for an active run to finish (or be cancelled) before
+proceeding.  The slot count can be changed at runtime with set_capacity().
 
 Usage
 -----
@@ -16,6 +17,7 @@ Usage
 
 import asyncio
 import logging
+from collections import deque
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -30,23 +32,48 @@ class RunQueue:
     """
     In-process FIFO run queue.
 
-    Guarantees one active run at a time.  Waiting runs queue up by
-    obtaining the asyncio.Lock in order.  Cancel requests set a flag that
-    graph nodes poll at case boundaries.
+    Guarantees at most `capacity` active runs (one by default).  Waiting runs
+    are admitted strictly in arrival order.  Cancel requests set an
+    asyncio.Event that graph nodes poll at case boundaries or await alongside
+    in-flight calls; cancel and active_run_id track the
+    most recently started run, which is exact at the default capacity of 1.
     """
 
-    def __init__(self) -> None:
-        self._lock = asyncio.Lock()
+    def __init__(self, capacity: int = 1) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self._cap = capacity
+        self._waiting: deque[object] = deque()
         self._active_run_id: str | None = None
-        self._cancel_requested: bool = False
+        self._cancel_event = asyncio.Event()
 
     @property
     def active_run_id(self) -> str | None:
         return self._active_run_id
 
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
     @property
     def is_busy(self) -> bool:
-        return self._lock.locked()
+        return self._active >= self._cap
+
+    async def set_capacity(self, capacity: int) -> None:
+        """
+        Change the number of runs allowed to execute concurrently.
+
+        Raising the capacity admits queued runs immediately; lowering it lets
+        active runs finish and holds new ones until the count drops below it.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        async with self._cond:
+            self._cap = capacity
+            self._cond.notify_all()
+        log.info("Run queue capacity set to %d.", capacity)
 
     def request_cancel(self) -> bool:
         """
@@ -55,13 +82,17 @@ class RunQueue:
         """
         if self._active_run_id is None:
             return False
-        self._cancel_requested = True
+        self._cancel_event.set()
         log.info("Cancel requested for run %s.", self._active_run_id)
         return True
 
     def check_cancel(self) -> bool:
         """Called by graph nodes at case boundaries to detect a pending cancel."""
-        return self._cancel_requested
+        return self._cancel_event.is_set()
+
+    async def wait_cancel(self) -> None:
+        """Block until a cancel is requested for the active run."""
+        await self._cancel_event.wait()
 
     @asynccontextmanager
     async def acquire(
@@ -70,21 +101,38 @@ class RunQueue:
         """
         Async context manager that serialises run execution.
 
-        On entry the caller waits for the lock (queued), then transitions
-        the run to `running`.  On exit (normal or exception) the run status
-        is updated and the lock is released so the next queued run can start.
+        On entry the caller waits for a free slot (queued), then transitions
+        the run to `running`.  On exit (normal or exception) the slot is
+        released so the next queued run can start.
         """
         log.info("Run %s waiting for queue slot.", run_id)
-        async with self._lock:
+        ticket = object()
+        async with self._cond:
+            self._waiting.append(ticket)
+            try:
+                # notify_all wakes every waiter; only the head of the FIFO may
+                # take a slot, so arrival order is preserved.
+                await self._cond.wait_for(
+                    lambda: self._active < self._cap and self._waiting[0] is ticket
+                )
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+            self._active += 1
             self._active_run_id = run_id
-            self._cancel_requested = False
+            self._cancel_event.clear()
+
+        try:
             await update_run_status(run_id, RunStatus.running, db)
             log.info("Run %s is now active.", run_id)
-            try:
-                yield
-            finally:
-                self._active_run_id = None
-                self._cancel_requested = False
+            yield
+        finally:
+            async with self._cond:
+                self._active -= 1
+                if self._active_run_id == run_id:
+                    self._active_run_id = None
+                    self._cancel_event.clear()
+                self._cond.notify_all()
 
 
 # ── Module-level singleton ─────────────────────────────────────────────────────
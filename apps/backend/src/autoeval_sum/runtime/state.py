@@ -3,10 +3,20 @@ LangGraph RunState TypedDict.
 
 All graph nodes receive and return an instance of RunState.  LangGraph
 merges the returned dict into the current state automatically.
+
+The graph is compiled without a checkpointer, so state lives only in memory:
+merges are top-level key replacements that share the returned objects by
+reference, and nothing is serialised between nodes.  Durable output is
+written explicitly (EvalResults by the judge nodes, runs and suites by
+finalize).  If a checkpointer is ever added, its serde is the place to
+choose a fast encoder and per-key delta writes.
 """
 
 from typing import Any, TypedDict
 
+from autoeval_sum.models.documents import EnrichedDocument
+from autoeval_sum.models.schemas import SuiteMetrics
+
 
 class CaseExecution(TypedDict):
     """Result of running the Summarizer for one eval case."""
@@ -35,14 +45,15 @@ class RunState(TypedDict, total=False):
     Flow fields (written progressively by each node)
     -------------------------------------------------
     docs            Enriched document items from DynamoDB
+    docs_enriched   The same items parsed once into EnrichedDocument
     eval_suite_v1   EvalCase list for iteration 1
     executions_v1   Summarizer results for iteration 1
     judge_results_v1  JudgeCaseResult list for iteration 1
-    metrics_v1      SuiteMetrics dict for iteration 1
+    metrics_v1      SuiteMetrics for iteration 1 (dumped only by finalize)
     eval_suite_v2   EvalCase list for iteration 2
     executions_v2   Summarizer results for iteration 2
     judge_results_v2  JudgeCaseResult list for iteration 2
-    metrics_v2      SuiteMetrics dict for iteration 2
+    metrics_v2      SuiteMetrics for iteration 2 (dumped only by finalize)
 
     Control fields
     --------------
@@ -60,18 +71,19 @@ class RunState(TypedDict, total=False):
 
     # Loaded corpus
     docs: list[dict[str, Any]]
+    docs_enriched: list[EnrichedDocument]
 
     # Iteration 1
     eval_suite_v1: list[dict[str, Any]]    # serialised EvalCase list
     executions_v1: list[CaseExecution]
     judge_results_v1: list[dict[str, Any]]  # serialised JudgeCaseResult list
-    metrics_v1: dict[str, Any] | None
+    metrics_v1: SuiteMetrics | None
 
     # Iteration 2
     eval_suite_v2: list[dict[str, Any]]
     executions_v2: list[CaseExecution]
     judge_results_v2: list[dict[str, Any]]
-    metrics_v2: dict[str, Any] | None
+    metrics_v2: SuiteMetrics | None
 
     # Pinecone context (populated by judge_v1 for use in curriculum_v2)
     pinecone_failure_exemplars: list[str]
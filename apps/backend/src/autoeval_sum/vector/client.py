@@ -2,8 +2,18 @@
 Pinecone vector client wrapper.
 
 Handles embedding via text-embedding-004 (Google GenAI) and all Pinecone
-operations: upsert, query, and fetch.  Synchronous Pinecone SDK calls are
-run in an executor to stay non-blocking in the async graph pipeline.
+operations: upsert, query, and fetch.  Pinecone is reached over gRPC, so all
+upserts and queries share one multiplexed HTTP/2 channel and the TLS
+handshake is paid once per process.  Synchronous Pinecone SDK and
+embedding calls run on a dedicated, sized thread pool (``vector_pool_size``)
+to stay non-blocking in the async graph pipeline without competing for the
+event loop's default executor.
+
+Embeddings are scaled to unit length as they are returned from the API, so
+Pinecone's cosine score equals the dot product and local similarity maths can
+use a plain dot product.  They are cached in an in-process LRU and, when
+``embedding_cache_path`` is set, in a persistent SQLite store
+(see ``emb_cache``) that survives restarts.
 
 Namespaces
 ----------
@@ -12,13 +22,23 @@ failures      — one vector per failing judge result; used for failure memory
 """
 
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 from google import genai as google_genai
-from pinecone import Pinecone
+from pinecone.grpc import PineconeGRPC
 
-from autoeval_sum.config.settings import get_settings
+from autoeval_sum.config.settings import Settings, get_settings
+from autoeval_sum.vector.emb_cache import (
+    SqliteEmbeddingCache,
+    decode_vector,
+    encode_vector,
+    text_hash,
+)
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +55,50 @@ _TASK_TYPE_MAP: dict[str, str] = {
 NS_EVAL_PROMPTS = "eval_prompts"
 NS_FAILURES = "failures"
 
+# Max texts per embed_content request, and batch requests kept in flight
+_EMBED_BATCH_SIZE = 100
+_EMBED_MAX_CONCURRENCY = 4
+
+# Vectors per Pinecone upsert request, and upsert requests kept in flight
+_UPSERT_BATCH_SIZE = 200
+_UPSERT_MAX_IN_FLIGHT = 8
+
+# In-process LRU of computed embeddings, keyed by (text digest, task type)
+_EMBED_CACHE_SIZE = 4096
+
+_EmbedKey = tuple[bytes, str]
+
+
+def normalize_rows(vectors: list[list[float]]) -> list[list[float]]:
+    """Scale each embedding to unit L2 norm (all-zero vectors stay zero)."""
+    if not vectors:
+        return []
+    arr = np.asarray(vectors, dtype=np.float32)
+    arr /= np.linalg.norm(arr, axis=1, keepdims=True) + np.float32(1e-12)
+    return arr.tolist()  # type: ignore[no-any-return]
+
+
+def _response_vectors(
+    result: google_genai.types.EmbedContentResponse,
+    expected: int,
+) -> list[list[float]]:
+    """
+    Unit-norm vectors from an embed_content response.
+
+    The SDK types ``embeddings`` and each ``values`` as Optional; a response
+    missing either, or with the wrong vector count, is an API failure.
+    """
+    embeddings = result.embeddings
+    if embeddings is None or len(embeddings) != expected:
+        got = 0 if embeddings is None else len(embeddings)
+        raise RuntimeError(f"Embedding response returned {got} vectors for {expected} inputs")
+    values: list[list[float]] = []
+    for embedding in embeddings:
+        if embedding.values is None:
+            raise RuntimeError("Embedding response contained a vector with no values")
+        values.append(embedding.values)
+    return normalize_rows(values)
+
 
 class PineconeClient:
     """
@@ -45,51 +109,220 @@ class PineconeClient:
     """
 
     def __init__(self) -> None:
-        self._pc: Pinecone | None = None
+        self._settings: Settings | None = None
+        self._pc: PineconeGRPC | None = None
         self._index: Any = None
         self._genai_client: google_genai.Client | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        # Vector ids already written by this process.  Ids are run-scoped
+        # ({run_id}#{suite}#{eval_id}[#fail]) and their content never changes,
+        # so a repeat upsert (retry, re-invoked node) can be skipped outright.
+        self._upserted_ids: set[str] = set()
+        # Only touched on the event loop thread (never inside executor calls),
+        # so no lock is needed.
+        self._emb_cache: OrderedDict[_EmbedKey, tuple[float, ...]] = OrderedDict()
+        self._disk_cache: SqliteEmbeddingCache | None = None
+        self._disk_cache_resolved = False
+        self._disk_cache_lock = asyncio.Lock()
+
+    def _get_settings(self) -> Settings:
+        """Settings bound on first use, so hot paths skip the get_settings() call."""
+        if self._settings is None:
+            self._settings = get_settings()
+        return self._settings
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._get_settings().vector_pool_size,
+                thread_name_prefix="vector",
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Release the IO thread pool and the persistent embedding cache.
+
+        Queued work is cancelled, but calls already running are waited for:
+        they may still write to the disk cache, so it is closed only once
+        the pool has drained.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+            self._disk_cache_resolved = False
 
     def _get_genai_client(self) -> google_genai.Client:
         if self._genai_client is None:
-            settings = get_settings()
+            settings = self._get_settings()
             self._genai_client = google_genai.Client(api_key=settings.google_api_key)
         return self._genai_client
 
     def _get_index(self) -> Any:
         if self._index is None:
-            settings = get_settings()
-            self._pc = Pinecone(api_key=settings.pinecone_api_key)
+            settings = self._get_settings()
+            self._pc = PineconeGRPC(api_key=settings.pinecone_api_key)
             self._index = self._pc.Index(settings.pinecone_index_name)
             log.debug("Pinecone index '%s' connected.", settings.pinecone_index_name)
         return self._index
 
     # ── Embedding ──────────────────────────────────────────────────────────────
 
-    def _embed_sync(self, text: str, task_type: str = _TASK_RETRIEVAL_DOCUMENT) -> list[float]:
-        """Synchronous Google embedding call via google-genai SDK."""
+    @staticmethod
+    def _embed_key(text: str, task_type: str) -> _EmbedKey:
+        return hashlib.blake2b(text.encode("utf-8")).digest(), task_type
+
+    def _cache_get(self, key: _EmbedKey) -> list[float] | None:
+        cached = self._emb_cache.get(key)
+        if cached is None:
+            return None
+        self._emb_cache.move_to_end(key)
+        return list(cached)
+
+    def _cache_put(self, key: _EmbedKey, embedding: list[float]) -> None:
+        self._emb_cache[key] = tuple(embedding)
+        self._emb_cache.move_to_end(key)
+        if len(self._emb_cache) > _EMBED_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+
+    async def _get_disk_cache(self) -> SqliteEmbeddingCache | None:
+        """
+        Open the persistent cache on first use.
+
+        Opening creates the directory, connects and sets the WAL pragmas, so
+        it runs on the vector pool rather than the event loop.
+        """
+        if not self._disk_cache_resolved:
+            async with self._disk_cache_lock:
+                if not self._disk_cache_resolved:
+                    path = self._get_settings().embedding_cache_path
+                    if path:
+                        loop = asyncio.get_running_loop()
+                        try:
+                            self._disk_cache = await loop.run_in_executor(
+                                self._get_pool(), SqliteEmbeddingCache, path
+                            )
+                        except Exception as exc:
+                            log.warning("Embedding cache unavailable at %s: %s", path, exc)
+                    self._disk_cache_resolved = True
+        return self._disk_cache
+
+    def _cache_model_key(self) -> str:
+        """Model identity for persisted (unit-norm) vectors: model + output dimension."""
+        settings = self._get_settings()
+        return f"{settings.embedding_model}@{settings.pinecone_embedding_dimension}/unit"
+
+    def _embed_batch_persisted_sync(
+        self,
+        texts: list[str],
+        task_type: str,
+        cache: SqliteEmbeddingCache | None,
+    ) -> list[list[float]]:
+        """``_embed_batch_sync`` behind the persistent cache; only misses are sent."""
+        if cache is None:
+            return self._embed_batch_sync(texts, task_type)
+        model = self._cache_model_key()
+        digests = [text_hash(text) for text in texts]
+        vectors = {
+            digest: decode_vector(blob)
+            for digest, blob in cache.get_many(digests, task_type, model).items()
+        }
+        missing = [(d, text) for d, text in zip(digests, texts, strict=True) if d not in vectors]
+        if missing:
+            fresh = self._embed_batch_sync([text for _, text in missing], task_type)
+            cache.put_many(
+                ((d, encode_vector(v)) for (d, _), v in zip(missing, fresh, strict=True)),
+                task_type,
+                model,
+            )
+            vectors.update((d, v) for (d, _), v in zip(missing, fresh, strict=True))
+        return [vectors[d] for d in digests]
+
+    def _embed_batch_sync(
+        self,
+        texts: list[str],
+        task_type: str = _TASK_RETRIEVAL_DOCUMENT,
+    ) -> list[list[float]]:
+        """Synchronous batched embedding call — one request for all `texts`."""
         from google.genai import types as genai_types
 
-        settings = get_settings()
+        settings = self._get_settings()
         client = self._get_genai_client()
         sdk_task_type = _TASK_TYPE_MAP.get(task_type, task_type.upper())
         result = client.models.embed_content(
             model=settings.embedding_model,
-            contents=text,
+            contents=texts,
             config=genai_types.EmbedContentConfig(
                 task_type=sdk_task_type,
                 output_dimensionality=settings.pinecone_embedding_dimension,
             ),
         )
-        return list(result.embeddings[0].values)
+        return _response_vectors(result, len(texts))
 
-    async def embed_text(
+    async def embed_batch(
         self,
-        text: str,
+        texts: list[str],
         task_type: str = _TASK_RETRIEVAL_DOCUMENT,
-    ) -> list[float]:
-        """Async wrapper around the synchronous embedding call."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._embed_sync, text, task_type)
+    ) -> list[list[float]]:
+        """
+        Embed several texts with batched requests; results follow input order.
+
+        Texts already in the LRU cache (or repeated within `texts`) are not
+        re-sent.  The rest go ``_EMBED_BATCH_SIZE`` per request, with at most
+        ``_EMBED_MAX_CONCURRENCY`` requests in flight at once.
+        """
+        keys = [self._embed_key(text, task_type) for text in texts]
+        results: dict[_EmbedKey, list[float]] = {}
+        missing: dict[_EmbedKey, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in results or key in missing:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing[key] = text
+
+        if missing:
+            embeddings = await self._embed_uncached(list(missing.values()), task_type)
+            for key, embedding in zip(missing, embeddings, strict=True):
+                self._cache_put(key, embedding)
+                results[key] = embedding
+        return [results[key] for key in keys]
+
+    async def embed_query_batch(self, texts: list[str]) -> list[list[float]]:
+        """``embed_batch`` with the retrieval-query task type used by all queries."""
+        return await self.embed_batch(texts, task_type=_TASK_RETRIEVAL_QUERY)
+
+    async def _embed_uncached(
+        self,
+        texts: list[str],
+        task_type: str,
+    ) -> list[list[float]]:
+        """Embed `texts` in chunked batch requests, bypassing the LRU cache."""
+        loop = asyncio.get_running_loop()
+        disk_cache = await self._get_disk_cache()
+        if len(texts) <= _EMBED_BATCH_SIZE:
+            return await loop.run_in_executor(
+                self._get_pool(), self._embed_batch_persisted_sync, texts, task_type, disk_cache
+            )
+
+        sem = asyncio.Semaphore(_EMBED_MAX_CONCURRENCY)
+
+        async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+            async with sem:
+                return await loop.run_in_executor(
+                    self._get_pool(), self._embed_batch_persisted_sync, chunk, task_type, disk_cache
+                )
+
+        chunks = await asyncio.gather(*(
+            embed_chunk(texts[i:i + _EMBED_BATCH_SIZE])
+            for i in range(0, len(texts), _EMBED_BATCH_SIZE)
+        ))
+        return [embedding for chunk in chunks for embedding in chunk]
 
     # ── Upsert ────────────────────────────────────────────────────────────────
 
@@ -111,12 +344,27 @@ class PineconeClient:
         Upsert pre-computed vectors to a namespace.
 
         Each vector dict must have: ``id`` (str), ``values`` (list[float]),
-        and optionally ``metadata`` (dict).
+        and optionally ``metadata`` (dict).  Ids this client has already
+        upserted are skipped.  Large lists are sent ``_UPSERT_BATCH_SIZE``
+        vectors per request with up to ``_UPSERT_MAX_IN_FLIGHT`` requests
+        in flight.
         """
+        vectors = [vector for vector in vectors if vector["id"] not in self._upserted_ids]
         if not vectors:
             return
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._upsert_sync, vectors, namespace)
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        sem = asyncio.Semaphore(_UPSERT_MAX_IN_FLIGHT)
+
+        async def upsert_chunk(chunk: list[dict[str, Any]]) -> None:
+            async with sem:
+                await loop.run_in_executor(pool, self._upsert_sync, chunk, namespace)
+            self._upserted_ids.update(vector["id"] for vector in chunk)
+
+        await asyncio.gather(*(
+            upsert_chunk(vectors[i:i + _UPSERT_BATCH_SIZE])
+            for i in range(0, len(vectors), _UPSERT_BATCH_SIZE)
+        ))
         log.debug("Upserted %d vectors to namespace '%s'.", len(vectors), namespace)
 
     async def embed_and_upsert(
@@ -137,17 +385,23 @@ class PineconeClient:
             Any additional keys are stored as metadata.
         namespace:
             Pinecone namespace to upsert into.
+
+        All texts are embedded via embed_batch rather than one request per item.
+        Items whose id this client has already upserted are skipped before
+        embedding.
         """
-        vectors = []
-        for item in items:
-            text = item[text_key]
-            embedding = await self.embed_text(text, task_type)
-            metadata = {k: v for k, v in item.items() if k not in (id_key, text_key)}
-            vectors.append({
+        items = [item for item in items if item[id_key] not in self._upserted_ids]
+        if not items:
+            return
+        embeddings = await self.embed_batch([item[text_key] for item in items], task_type)
+        vectors = [
+            {
                 "id": item[id_key],
                 "values": embedding,
-                "metadata": metadata,
-            })
+                "metadata": {k: v for k, v in item.items() if k not in (id_key, text_key)},
+            }
+            for item, embedding in zip(items, embeddings, strict=True)
+        ]
         await self.upsert_vectors(vectors, namespace)
 
     # ── Query ─────────────────────────────────────────────────────────────────
@@ -157,41 +411,76 @@ class PineconeClient:
         vector: list[float],
         namespace: str,
         top_k: int,
+        include_metadata: bool = True,
     ) -> list[dict[str, Any]]:
-        """Synchronous Pinecone query."""
+        """
+        Synchronous Pinecone query.
+
+        With ``include_metadata=False`` Pinecone omits metadata from the
+        response and each match is just ``id`` and ``score``.
+        """
         index = self._get_index()
         response = index.query(
             vector=vector,
             top_k=top_k,
-            include_metadata=True,
+            include_metadata=include_metadata,
             namespace=namespace,
         )
+        matches = response.get("matches", [])
+        if not include_metadata:
+            return [{"id": match["id"], "score": float(match["score"])} for match in matches]
         return [
             {
                 "id": match["id"],
                 "score": float(match["score"]),
                 "metadata": match.get("metadata", {}),
             }
-            for match in response.get("matches", [])
+            for match in matches
         ]
 
-    async def query_similar(
+    async def query_similar_batch(
         self,
-        text: str,
+        texts: list[str],
         namespace: str,
         top_k: int = 5,
+        max_concurrency: int = 8,
+        include_metadata: bool = True,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Embed all `texts` in batched requests and query each vector concurrently.
+
+        Returns one match list per text, in input order (see ``query_by_vector``).
+        At most `max_concurrency` Pinecone queries are in flight at once.
+        """
+        vectors = await self.embed_query_batch(texts)
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def query(vector: list[float]) -> list[dict[str, Any]]:
+            async with sem:
+                return await self.query_by_vector(
+                    vector, namespace, top_k, include_metadata=include_metadata
+                )
+
+        return list(await asyncio.gather(*(query(v) for v in vectors)))
+
+    async def query_by_vector(
+        self,
+        vector: list[float],
+        namespace: str,
+        top_k: int = 5,
+        include_metadata: bool = True,
     ) -> list[dict[str, Any]]:
         """
-        Embed `text` and return the top-k most similar vectors.
+        Return the top-k most similar vectors to a pre-computed embedding.
 
         Returns
         -------
-        list of dicts with keys: ``id``, ``score`` (cosine similarity), ``metadata``.
+        list of dicts with keys: ``id``, ``score`` (cosine similarity), and
+        ``metadata`` unless `include_metadata` is False.
         """
-        vector = await self.embed_text(text, task_type=_TASK_RETRIEVAL_QUERY)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         results = await loop.run_in_executor(
-            None, self._query_sync, vector, namespace, top_k
+            self._get_pool(), self._query_sync, vector, namespace, top_k, include_metadata
         )
         return results
 
@@ -207,3 +496,9 @@ def get_pinecone_client() -> PineconeClient:
     if _client is None:
         _client = PineconeClient()
     return _client
+
+
+def close_pinecone_client() -> None:
+    """Release the singleton's thread pool and cache, if it was ever created."""
+    if _client is not None:
+        _client.close()
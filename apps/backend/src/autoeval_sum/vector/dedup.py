@@ -4,56 +4,56 @@ Eval prompt deduplication logic.
 Checks whether a candidate eval case is semantically near-duplicate to any
 existing eval prompt already stored in the ``eval_prompts`` Pinecone namespace.
 Threshold: cosine similarity >= 0.90 → reject.
+
+A candidate suite is checked in one round: texts are embedded as retrieval
+queries in batched requests and the Pinecone queries run concurrently under a
+small semaphore.  Candidates are first compared with each other locally:
+embeddings are unit-norm, so one matrix product gives every pairwise cosine,
+and a candidate too close to an earlier kept candidate is rejected without a
+Pinecone round trip.
 """
 
+import asyncio
 import logging
 from typing import Any
 
+import numpy as np
+
 from autoeval_sum.vector.client import NS_EVAL_PROMPTS, PineconeClient
+from autoeval_sum.vector.memory import eval_case_text
 
 log = logging.getLogger(__name__)
 
 DEDUP_THRESHOLD = 0.90
 
-
-def _case_text(case: dict[str, Any]) -> str:
-    """Build the text to embed for dedup comparison."""
-    parts = [case.get("prompt_template", "")]
-    note = case.get("rubric_note", "")
-    if note:
-        parts.append(note)
-    return " ".join(parts).strip()
+# Dedup checks (embed + query round trips) kept in flight at once
+_DEDUP_CONCURRENCY = 8
 
 
-async def is_near_duplicate(
-    prompt_text: str,
+async def is_near_duplicate_vector(
+    vector: list[float],
     client: PineconeClient,
 ) -> bool:
     """
-    Return True if `prompt_text` is too similar to an existing eval prompt.
-
-    Parameters
-    ----------
-    prompt_text:
-        The candidate eval case text (prompt_template + rubric_note).
-    client:
-        Initialised PineconeClient.
+    Return True if `vector` is too similar to an existing eval prompt.
 
-    Returns
-    -------
-    bool
-        True if top-1 similarity >= DEDUP_THRESHOLD (0.90).
+    `vector` must be a retrieval-query embedding of the candidate text
+    (prompt_template + rubric_note); True if the top-1 similarity is
+    >= DEDUP_THRESHOLD (0.90).
     """
     try:
-        matches = await client.query_similar(
-            prompt_text,
-            namespace=NS_EVAL_PROMPTS,
-            top_k=1,
+        matches = await client.query_by_vector(
+            vector, namespace=NS_EVAL_PROMPTS, top_k=1, include_metadata=False
         )
     except Exception as exc:
         log.warning("Dedup query failed; treating as non-duplicate: %s", exc)
         return False
 
+    return _is_duplicate_match(matches)
+
+
+def _is_duplicate_match(matches: list[dict[str, Any]]) -> bool:
+    """Return True if the top-1 match meets DEDUP_THRESHOLD."""
     if not matches:
         return False
 
@@ -72,6 +72,8 @@ async def filter_duplicates(
     """
     Filter out near-duplicate eval cases from a candidate v2 suite.
 
+    All queries run concurrently, at most ``_DEDUP_CONCURRENCY`` at a time.
+
     Parameters
     ----------
     cases:
@@ -85,18 +87,11 @@ async def filter_duplicates(
         accepted   — cases that passed the dedup check
         rejected_count — number of cases removed
     """
-    accepted: list[dict[str, Any]] = []
-    rejected = 0
-
-    for case in cases:
-        text = _case_text(case)
-        if not text:
-            accepted.append(case)
-            continue
+    flags = await check_batch(cases, client)
 
-        duplicate = await is_near_duplicate(text, client)
+    accepted: list[dict[str, Any]] = []
+    for case, duplicate in zip(cases, flags, strict=True):
         if duplicate:
-            rejected += 1
             log.info(
                 "Dedup: rejected case %s (too similar to existing prompts).",
                 case.get("eval_id"),
@@ -104,7 +99,85 @@ async def filter_duplicates(
         else:
             accepted.append(case)
 
+    rejected = len(cases) - len(accepted)
     if rejected:
         log.info("Dedup: %d/%d cases rejected from v2 suite.", rejected, len(cases))
 
     return accepted, rejected
+
+
+async def check_batch(cases: list[dict[str, Any]], client: PineconeClient) -> list[bool]:
+    """
+    Return a near-duplicate flag per case, in input order.
+
+    All case texts are embedded as retrieval queries in one batched request.
+    Candidates are then compared with each
+    other locally, and only the survivors are queried against Pinecone, as a
+    single concurrent burst.  Cases with no text are never duplicates.
+    """
+    texts = [eval_case_text(case) for case in cases]
+    pending = [i for i, text in enumerate(texts) if text]
+    if not pending:
+        return [False] * len(cases)
+
+    try:
+        embedded = await client.embed_query_batch([texts[i] for i in pending])
+    except Exception as exc:
+        log.warning("Dedup embedding failed; treating as non-duplicate: %s", exc)
+        return [False] * len(cases)
+
+    vectors: list[list[float] | None] = [None] * len(cases)
+    for i, vector in zip(pending, embedded, strict=True):
+        vectors[i] = vector
+    return await _check_vectors(vectors, client)
+
+
+async def _check_vectors(
+    vectors: list[list[float] | None],
+    client: PineconeClient,
+) -> list[bool]:
+    """
+    Duplicate flag per query vector (None = nothing to check).
+
+    Intra-suite duplicates are caught locally (see ``_local_duplicates``);
+    only the remaining vectors are queried against Pinecone, concurrently.
+    """
+    flags = _local_duplicates(vectors)
+    sem = asyncio.Semaphore(_DEDUP_CONCURRENCY)
+
+    async def check(vector: list[float] | None, local_duplicate: bool) -> bool:
+        if local_duplicate:
+            return True
+        if vector is None:
+            return False
+        async with sem:
+            return await is_near_duplicate_vector(vector, client)
+
+    return list(
+        await asyncio.gather(*(check(v, dup) for v, dup in zip(vectors, flags, strict=True)))
+    )
+
+
+def _local_duplicates(vectors: list[list[float] | None]) -> list[bool]:
+    """
+    Flag each vector that is a near-duplicate of an earlier, unflagged one.
+
+    Embeddings are unit-norm, so the gram matrix of the suite holds every
+    pairwise cosine similarity.  Missing vectors are never flagged.
+    """
+    flags = [False] * len(vectors)
+    present = [i for i, v in enumerate(vectors) if v is not None]
+    if len(present) < 2:
+        return flags
+
+    matrix = np.asarray([vectors[i] for i in present], dtype=np.float32)
+    sims = matrix @ matrix.T
+
+    kept: list[int] = []
+    for row, i in enumerate(present):
+        if kept and float(sims[row, kept].max()) >= DEDUP_THRESHOLD:
+            flags[i] = True
+            log.debug("Dedup reject — case #%d duplicates an earlier candidate", i)
+        else:
+            kept.append(row)
+    return flags
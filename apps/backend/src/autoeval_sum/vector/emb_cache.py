@@ -0,0 +1,114 @@
+"""
+Persistent embedding cache backed by SQLite.
+
+Sits behind PineconeClient's in-process LRU so identical texts are embedded
+once across runs and process restarts, not just once per process.
+
+Vectors are stored as raw little-endian float32 blobs (dimension × 4 bytes)
+under a (sha256 of text, task_type, model) primary key.  The database runs in
+WAL mode with a single connection per process, shared by the executor threads
+that perform embedding calls and serialised with a lock.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+_VECTOR_DTYPE = np.dtype("<f4")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    text_hash TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    model     TEXT NOT NULL,
+    vector    BLOB NOT NULL,
+    PRIMARY KEY (text_hash, task_type, model)
+) WITHOUT ROWID
+"""
+
+
+def text_hash(text: str) -> str:
+    """Return the cache key digest for `text`."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: list[float]) -> bytes:
+    """Pack an embedding as little-endian float32 bytes."""
+    return np.asarray(vector, dtype=_VECTOR_DTYPE).tobytes()
+
+
+def decode_vector(blob: bytes) -> list[float]:
+    """Unpack a blob written by ``encode_vector``."""
+    return cast(list[float], np.frombuffer(blob, dtype=_VECTOR_DTYPE).tolist())
+
+
+class SqliteEmbeddingCache:
+    """
+    Durable text → embedding store.
+
+    Thread-safe: every statement runs under one lock on one connection.
+    """
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+        log.debug("Embedding cache opened at %s.", path)
+
+    def get_many(
+        self,
+        text_hashes: Iterable[str],
+        task_type: str,
+        model: str,
+    ) -> dict[str, bytes]:
+        """Return a text_hash → blob map for every hash that is cached."""
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for digest in text_hashes:
+                row = self._conn.execute(
+                    "SELECT vector FROM embeddings"
+                    " WHERE text_hash = ? AND task_type = ? AND model = ?",
+                    (digest, task_type, model),
+                ).fetchone()
+                if row is not None:
+                    found[digest] = row[0]
+        return found
+
+    def put_many(
+        self,
+        entries: Iterable[tuple[str, bytes]],
+        task_type: str,
+        model: str,
+    ) -> None:
+        """Store several (text_hash, blob) pairs in one transaction."""
+        rows = [(digest, task_type, model, blob) for digest, blob in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings"
+                    " (text_hash, task_type, model, vector) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -6,32 +6,32 @@ Two operations:
                           future dedup checks can compare against them.
 2. store_failures       — index failing judge results into failures namespace
                           so the curriculum can retrieve failure exemplars.
-3. retrieve_failure_exemplars — query failures namespace and return formatted
-                          strings the curriculum agent can reason about.
+3. retrieve_failure_exemplars_per_tag — query failures namespace (one bucket
+                          per tag, embedded in a single batch) and return
+                          formatted strings the curriculum agent can reason
+                          about.
 """
 
 import logging
 from typing import Any
 
+from autoeval_sum.models.judge_columns import JudgeResultsColumns
 from autoeval_sum.vector.client import NS_EVAL_PROMPTS, NS_FAILURES, PineconeClient
 
 log = logging.getLogger(__name__)
 
 
-def _eval_case_text(case: dict[str, Any]) -> str:
-    """Build the embedding text for an eval case."""
-    parts = [case.get("prompt_template", "")]
-    note = case.get("rubric_note", "")
-    if note:
-        parts.append(note)
-    return " ".join(parts).strip()
+def eval_case_text(case: dict[str, Any]) -> str:
+    """Build the embedding text for an eval case (prompt_template + rubric_note)."""
+    prompt = case.get("prompt_template") or ""
+    note = case.get("rubric_note") or ""
+    return f"{prompt} {note}".strip() if note else prompt.strip()
 
 
 def _failure_text(result: dict[str, Any]) -> str:
     """Build the embedding text for a failure record."""
-    tags = ", ".join(result.get("failure_tags", []))
-    rationale = result.get("rationale", "")
-    return f"Failure tags: {tags}. Rationale: {rationale}".strip()
+    tags = ", ".join(result.get("failure_tags", ()))
+    return f"Failure tags: {tags}. Rationale: {result.get('rationale', '')}".rstrip()
 
 
 async def upsert_eval_prompts(
@@ -63,7 +63,7 @@ async def upsert_eval_prompts(
     items = [
         {
             "id": f"{run_id}#{suite_version}#{case['eval_id']}",
-            "text": _eval_case_text(case),
+            "text": text,
             "eval_id": case.get("eval_id", ""),
             "doc_id": case.get("doc_id", ""),
             "run_id": run_id,
@@ -72,7 +72,7 @@ async def upsert_eval_prompts(
             "category_tag": case.get("category_tag", ""),
         }
         for case in eval_suite
-        if _eval_case_text(case)
+        if (text := eval_case_text(case))
     ]
 
     if not items:
@@ -94,6 +94,7 @@ async def store_failures(
     run_id: str,
     suite_version: str,
     client: PineconeClient,
+    columns: JudgeResultsColumns | None = None,
 ) -> None:
     """
     Index failing judge results into the failures namespace.
@@ -114,9 +115,15 @@ async def store_failures(
         "v1" or "v2".
     client:
         Initialised PineconeClient.
+    columns:
+        Optional JudgeResultsColumns over `judge_results`; failing results
+        are then selected with its pass mask.
     """
     suite_by_id = {c["eval_id"]: c for c in eval_suite}
-    failing = [r for r in judge_results if not r.get("pass", True)]
+    if columns is not None:
+        failing = [judge_results[i] for i in columns.failing_indices()]
+    else:
+        failing = [r for r in judge_results if not r.get("pass", True)]
 
     if not failing:
         log.debug("No failing results to store for run %s %s.", run_id, suite_version)
@@ -155,10 +162,11 @@ async def store_failures(
         log.error("Failed to store failures in Pinecone: %s", exc)
 
 
-async def retrieve_failure_exemplars(
+async def retrieve_failure_exemplars_per_tag(
     failure_tags: list[str],
     client: PineconeClient,
-    top_k: int = 10,
+    top_k_per_tag: int = 3,
+    max_exemplars: int = 10,
 ) -> list[str]:
     """
     Query the failures namespace for exemplars matching the given failure tags.
@@ -166,42 +174,60 @@ async def retrieve_failure_exemplars(
     Returns a list of human-readable strings the curriculum agent can include
     in its prompt context to guide targeted v2 case generation.
 
+    All tag queries are embedded in one batched request and the Pinecone
+    queries run concurrently.  Buckets are merged, a record matched by
+    several tags is kept once at its best score, and the result is ordered
+    by descending similarity.
+
     Parameters
     ----------
     failure_tags:
         Top failure tags from the v1 suite (e.g. ["hallucinated_fact", "poor_structure"]).
     client:
         Initialised PineconeClient.
-    top_k:
-        Maximum exemplars to retrieve.
+    top_k_per_tag:
+        Matches retrieved per tag.
+    max_exemplars:
+        Cap on the merged list, which bounds the curriculum prompt context.
     """
     if not failure_tags:
         return []
 
-    query_text = f"Failure tags: {', '.join(failure_tags)}"
+    queries = [f"Failure tags: {tag}" for tag in failure_tags]
 
     try:
-        matches = await client.query_similar(
-            query_text,
+        buckets = await client.query_similar_batch(
+            queries,
             namespace=NS_FAILURES,
-            top_k=top_k,
+            top_k=top_k_per_tag,
         )
     except Exception as exc:
         log.warning("Failed to retrieve failure exemplars from Pinecone: %s", exc)
         return []
 
-    exemplars: list[str] = []
-    for match in matches:
-        meta = match.get("metadata", {})
-        tags = meta.get("failure_tags", "")
-        score = match.get("score", 0.0)
-        diff = meta.get("difficulty_tag", "")
-        cat = meta.get("category_tag", "")
-        exemplars.append(
-            f"[score={score:.2f}] {tags}"
-            + (f" | difficulty={diff}" if diff else "")
-            + (f" | category={cat}" if cat else "")
-        )
+    best: dict[str, dict[str, Any]] = {}
+    for match in (m for bucket in buckets for m in bucket):
+        seen = best.get(match["id"])
+        if seen is None or match.get("score", 0.0) > seen.get("score", 0.0):
+            best[match["id"]] = match
 
-    log.debug("Retrieved %d failure exemplars for tags: %s", len(exemplars), failure_tags[:3])
+    ranked = sorted(best.values(), key=lambda m: m.get("score", 0.0), reverse=True)
+    del ranked[max_exemplars:]
+    exemplars = [_format_exemplar(match) for match in ranked]
+
+    log.debug(
+        "Retrieved %d failure exemplars across %d tags.", len(exemplars), len(failure_tags)
+    )
     return exemplars
+
+
+def _format_exemplar(match: dict[str, Any]) -> str:
+    """Render one failures-namespace match as a curriculum context line."""
+    meta = match.get("metadata", {})
+    diff = meta.get("difficulty_tag", "")
+    cat = meta.get("category_tag", "")
+    return (
+        f"[score={match.get('score', 0.0):.2f}] {meta.get('failure_tags', '')}"
+        + (f" | difficulty={diff}" if diff else "")
+        + (f" | category={cat}" if cat else "")
+    )
@@ -0,0 +1,86 @@
+"""Unit tests for DynamoDBClient.batch_put_items against a stubbed resource."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from autoeval_sum.db import client as client_module
+from autoeval_sum.db.client import DynamoDBClient
+
+TABLE = "EvalSuites"
+
+
+class _StubResource:
+    """Records batch_write_item calls and replays canned responses."""
+
+    def __init__(self, responses: list[dict[str, Any]]) -> None:
+        self.responses = responses
+        self.calls: list[dict[str, Any]] = []
+
+    async def batch_write_item(self, RequestItems: dict[str, Any]) -> dict[str, Any]:  # noqa: N803
+        self.calls.append(RequestItems)
+        return self.responses.pop(0) if self.responses else {}
+
+
+class _StubSession:
+    def __init__(self, resource: _StubResource) -> None:
+        self._resource = resource
+
+    @asynccontextmanager
+    async def resource(self, *args: Any, **kwargs: Any) -> AsyncIterator[_StubResource]:
+        yield self._resource
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "_BATCH_WRITE_BASE_DELAY", 0.0)
+
+
+def _client(resource: _StubResource) -> DynamoDBClient:
+    db = DynamoDBClient(TABLE)
+    db._session = _StubSession(resource)  # type: ignore[assignment]
+    return db
+
+
+def _unprocessed(*pks: str) -> dict[str, Any]:
+    return {"UnprocessedItems": {TABLE: [{"PutRequest": {"Item": {"pk": pk}}} for pk in pks]}}
+
+
+async def test_items_are_chunked_to_the_batch_limit() -> None:
+    resource = _StubResource([])
+    items = [{"pk": f"item-{i}", "score": 0.5} for i in range(30)]
+
+    await _client(resource).batch_put_items(items)
+
+    assert [len(call[TABLE]) for call in resource.calls] == [25, 5]
+    assert resource.calls[0][TABLE][0]["PutRequest"]["Item"]["score"] == Decimal("0.5")
+
+
+async def test_unprocessed_items_are_retried() -> None:
+    resource = _StubResource([_unprocessed("item-1"), {}])
+
+    await _client(resource).batch_put_items([{"pk": "item-0"}, {"pk": "item-1"}])
+
+    assert len(resource.calls) == 2
+    assert resource.calls[1] == _unprocessed("item-1")["UnprocessedItems"]
+
+
+async def test_persistently_unprocessed_items_raise() -> None:
+    attempts = client_module._BATCH_WRITE_MAX_ATTEMPTS
+    resource = _StubResource([_unprocessed("item-0") for _ in range(attempts)])
+
+    with pytest.raises(RuntimeError, match="1 unprocessed item"):
+        await _client(resource).batch_put_items([{"pk": "item-0"}])
+
+    assert len(resource.calls) == attempts
+
+
+async def test_empty_batch_makes_no_request() -> None:
+    resource = _StubResource([])
+
+    await _client(resource).batch_put_items([])
+
+    assert resource.calls == []
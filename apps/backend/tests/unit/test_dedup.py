@@ -0,0 +1,42 @@
+"""Unit tests for the local intra-suite dedup pass."""
+
+import math
+
+from autoeval_sum.vector.dedup import DEDUP_THRESHOLD, _local_duplicates
+
+
+def _unit(angle: float) -> list[float]:
+    """A 2-d unit vector at `angle` radians; cosine between two is cos(Δangle)."""
+    return [math.cos(angle), math.sin(angle)]
+
+
+# Angle whose cosine sits just inside / just outside the dedup threshold
+_NEAR = math.acos(DEDUP_THRESHOLD) * 0.9
+_FAR = math.acos(DEDUP_THRESHOLD) * 1.1
+
+
+def test_identical_vectors_flag_the_later_one() -> None:
+    assert _local_duplicates([_unit(0.0), _unit(0.0)]) == [False, True]
+
+
+def test_vectors_below_threshold_are_kept() -> None:
+    assert _local_duplicates([_unit(0.0), _unit(_FAR), _unit(2 * _FAR)]) == [False, False, False]
+
+
+def test_missing_vectors_are_never_flagged_or_compared() -> None:
+    vectors = [None, _unit(0.0), None, _unit(_NEAR)]
+
+    assert _local_duplicates(vectors) == [False, False, False, True]
+
+
+def test_flagged_vectors_do_not_reject_later_ones() -> None:
+    # b duplicates a and is dropped; c is near b but not a, so it survives.
+    vectors = [_unit(0.0), _unit(_NEAR), _unit(2 * _NEAR)]
+
+    assert _local_duplicates(vectors) == [False, True, False]
+
+
+def test_fewer_than_two_vectors_need_no_comparison() -> None:
+    assert _local_duplicates([]) == []
+    assert _local_duplicates([_unit(0.0)]) == [False]
+    assert _local_duplicates([None, None]) == [False, False]
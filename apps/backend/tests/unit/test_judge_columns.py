@@ -0,0 +1,42 @@
+"""Unit tests for JudgeResultsColumns.lowest_indices."""
+
+import pytest
+
+from autoeval_sum.models.judge_columns import SCORE_DIMENSIONS, JudgeResultsColumns
+
+# Heavy ties, including at every possible k-th boundary
+AGGREGATES = [3.0, 1.0, 2.0, 1.0, 3.0, 2.0, 1.0, 4.0, 2.0, 3.0]
+
+
+def _columns(aggregates: list[float]) -> JudgeResultsColumns:
+    return JudgeResultsColumns(
+        [
+            {
+                "eval_id": f"case-{i}",
+                "scores": dict.fromkeys(SCORE_DIMENSIONS, score),
+                "aggregate_score": score,
+                "pass": True,
+                "failure_tags": [],
+            }
+            for i, score in enumerate(aggregates)
+        ]
+    )
+
+
+def _expected(aggregates: list[float], k: int) -> list[int]:
+    """Reference: stable sort by aggregate, so ties keep input order."""
+    return sorted(range(len(aggregates)), key=lambda i: aggregates[i])[: max(k, 0)]
+
+
+@pytest.mark.parametrize("k", range(-1, len(AGGREGATES) + 3))
+def test_lowest_indices_matches_stable_sort_with_ties(k: int) -> None:
+    columns = _columns(AGGREGATES)
+
+    assert columns.lowest_indices(k).tolist() == _expected(AGGREGATES, k)
+
+
+def test_lowest_indices_on_empty_results() -> None:
+    columns = _columns([])
+
+    assert columns.lowest_indices(0).tolist() == []
+    assert columns.lowest_indices(3).tolist() == []
@@ -0,0 +1,127 @@
+"""Unit tests for RunQueue admission order, waiter cancellation and capacity."""
+
+import asyncio
+
+import pytest
+
+from autoeval_sum.runtime import queue as queue_module
+from autoeval_sum.runtime.queue import RunQueue
+
+
+@pytest.fixture(autouse=True)
+def _no_status_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def update_run_status(*args: object, **kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(queue_module, "update_run_status", update_run_status)
+
+
+async def _settle() -> None:
+    """Let every runnable task advance until it blocks."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class _Run:
+    """A run that holds its queue slot until released."""
+
+    def __init__(self, queue: RunQueue, run_id: str, admitted: list[str]) -> None:
+        self.release = asyncio.Event()
+        self.task = asyncio.create_task(self._hold(queue, run_id, admitted))
+
+    async def _hold(self, queue: RunQueue, run_id: str, admitted: list[str]) -> None:
+        async with queue.acquire(run_id, None):  # type: ignore[arg-type]
+            admitted.append(run_id)
+            await self.release.wait()
+
+    async def finish(self) -> None:
+        self.release.set()
+        await self.task
+
+
+async def test_waiters_are_admitted_in_arrival_order() -> None:
+    queue = RunQueue()
+    admitted: list[str] = []
+    runs = {}
+    for run_id in ("a", "b", "c", "d"):
+        runs[run_id] = _Run(queue, run_id, admitted)
+        await _settle()
+
+    assert admitted == ["a"]
+    assert queue.is_busy
+
+    for run_id in ("a", "b", "c"):
+        await runs[run_id].finish()
+        await _settle()
+
+    assert admitted == ["a", "b", "c", "d"]
+    await runs["d"].finish()
+    assert not queue.is_busy
+
+
+async def test_waiter_cancelled_while_queued_is_removed() -> None:
+    queue = RunQueue()
+    admitted: list[str] = []
+    first = _Run(queue, "a", admitted)
+    await _settle()
+    cancelled = _Run(queue, "b", admitted)
+    await _settle()
+    last = _Run(queue, "c", admitted)
+    await _settle()
+
+    cancelled.task.cancel()
+    await _settle()
+    assert cancelled.task.cancelled()
+    assert len(queue._waiting) == 1
+
+    await first.finish()
+    await _settle()
+    assert admitted == ["a", "c"]
+    await last.finish()
+    assert not queue._waiting
+
+
+async def test_raising_capacity_admits_queued_runs() -> None:
+    queue = RunQueue()
+    admitted: list[str] = []
+    first = _Run(queue, "a", admitted)
+    await _settle()
+    second = _Run(queue, "b", admitted)
+    await _settle()
+    assert admitted == ["a"]
+
+    await queue.set_capacity(2)
+    await _settle()
+    assert admitted == ["a", "b"]
+
+    await first.finish()
+    await second.finish()
+
+
+async def test_lowering_capacity_holds_new_runs_until_below_it() -> None:
+    queue = RunQueue(capacity=2)
+    admitted: list[str] = []
+    first = _Run(queue, "a", admitted)
+    second = _Run(queue, "b", admitted)
+    await _settle()
+    assert admitted == ["a", "b"]
+
+    await queue.set_capacity(1)
+    third = _Run(queue, "c", admitted)
+    await _settle()
+
+    await first.finish()
+    await _settle()
+    assert admitted == ["a", "b"]
+
+    await second.finish()
+    await _settle()
+    assert admitted == ["a", "b", "c"]
+    await third.finish()
+
+
+async def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        RunQueue(capacity=0)
+    with pytest.raises(ValueError):
+        await RunQueue().set_capacity(0)